@@ -0,0 +1,782 @@
+"""
+archive-helper.py — Python engine for archive-helper.sh.
+
+Requirements: Python 3.9+ and 7za on PATH.
+
+Takes the same options as archive-helper.sh (see its header for what each
+one does) and produces the same archives, but avoids most of the staging
+I/O the shell version does:
+
+    - Zips are classified as single-file / multi-file from their central
+      directory (zipfile's member list). Nothing is extracted to decide.
+      Directory entries don't count towards the member total.
+    - In --repack mode a single-file zip (and, with --unzip-inner, a
+      single-file zip nested in one) is decompressed straight into
+      7za's stdin (-si), so no staging directory is written at all.
+      Multi-file zips still extract to a per-job staging dir.
+    - Members zipfile can't decode (e.g. Deflate64, used by Windows for
+      large zips) are extracted with unzip, or 7za if unzip is missing.
+    - A zip that fails for any reason is reported as "WARN ... skipping"
+      and the rest of the run carries on, as in the .sh.
+    - In merge mode, zips that go into the archive as-is are hard-linked
+      into the staging dir instead of copied (copied only when the
+      filesystem refuses links).
+    - --parallel N runs repack jobs in a process pool.
+    - Progress is journalled next to the directory (one JSON line per
+      finished zip, keyed by name, size and mtime): repacks in
+      "<directory>.journal.jsonl", merge staging in
+      "<directory>-staging.journal.jsonl". A re-run skips journalled
+      zips without opening them; an interrupted merge keeps its staging
+      dir and continues from the first unstaged zip.
+    - 7za always writes to "<name>.7z.part" and the file is renamed once
+      verified, so an interrupted run never leaves a .7z that looks done.
+
+Usage:
+    ./archive-helper.py [options] <directory>
+    ./archive-helper.sh --python [options] <directory>
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from io import BytesIO
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+
+# ============================================================================
+# CONFIGURATION (defaults — overridable via CLI flags, as in the .sh)
+# ============================================================================
+
+UNZIP_ALL = False
+CONTAINER = False
+NO_UNZIP = False
+FOLDERED = False
+UNZIP_INNER = False
+DELETE_ORIGINALS = False
+REPACK = False
+SKIP_7Z = False
+RESUME_PACK = False
+LEVEL = 9
+DICT = "1g"
+SOLID = "on"
+DRY_RUN = False
+VERIFY_ONLY = False
+PASSWORD = ""
+CHECKSUM = False
+PARALLEL = 1
+
+# Inner zips up to this size are opened in memory so their member can be
+# streamed into 7za; larger ones go through a staging dir.
+INNER_MEMORY_LIMIT = 256 * 1024 * 1024
+COPY_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Compression methods zipfile can decode. Anything else (notably Deflate64,
+# which Windows uses for large zips) is extracted with unzip or 7za.
+ZIPFILE_METHODS = {zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED,
+                   zipfile.ZIP_BZIP2, zipfile.ZIP_LZMA}
+
+CONFIG_NAMES = [
+    "UNZIP_ALL", "CONTAINER", "NO_UNZIP", "FOLDERED", "UNZIP_INNER",
+    "DELETE_ORIGINALS", "REPACK", "SKIP_7Z", "RESUME_PACK", "LEVEL", "DICT",
+    "SOLID", "DRY_RUN", "VERIFY_ONLY", "PASSWORD", "CHECKSUM", "PARALLEL",
+]
+
+
+class ArchiveError(Exception):
+    """A zip couldn't be read or 7za failed."""
+
+
+# ============================================================================
+# 7ZA HELPERS
+# ============================================================================
+
+def pack_args() -> List[str]:
+    """7za compression args for the current flags (pack_args in the .sh)."""
+    args = ["-mx=0"] if CONTAINER else [f"-mx={LEVEL}", f"-md={DICT}", f"-ms={SOLID}"]
+    if PASSWORD:
+        args += [f"-p{PASSWORD}", "-mhe=on"]
+    return args
+
+
+def run_7za(args: List[str], stdin: Optional[BinaryIO] = None) -> None:
+    """Run 7za with args, optionally feeding stdin from a file object."""
+    cmd = ["7za"] + args
+    if DRY_RUN:
+        print("DRY:", " ".join(cmd) + (" < (stream)" if stdin else ""))
+        return
+
+    if stdin is None:
+        rc = subprocess.call(cmd)
+    else:
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+        try:
+            shutil.copyfileobj(stdin, proc.stdin, COPY_CHUNK_SIZE)
+        except BrokenPipeError:
+            pass  # 7za died; its exit code says why
+        finally:
+            proc.stdin.close()
+        rc = proc.wait()
+    if rc != 0:
+        raise ArchiveError(f"7za {args[0]} exited with {rc}")
+
+
+def pack_paths(out: str, inputs: List[str]) -> None:
+    """7za a <out> <inputs...> (pack_archive in the .sh)."""
+    run_7za(["a", "-t7z"] + pack_args() + [out] + inputs)
+
+
+def pack_stream(out: str, name: str, src: BinaryIO) -> None:
+    """Add one file to <out> as <name>, reading its bytes from src via -si."""
+    run_7za(["a", "-t7z"] + pack_args() + [f"-si{name}", out], stdin=src)
+
+
+def verify_archive(archive: str) -> None:
+    args = ["t", "-t7z"]
+    if PASSWORD:
+        args.append(f"-p{PASSWORD}")
+    run_7za(args + [archive])
+
+
+def sha256_of(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(COPY_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_checksum(archive: str) -> None:
+    """Write a sha256sum-compatible .sha256 sidecar (if --checksum)."""
+    if not CHECKSUM:
+        return
+    if DRY_RUN:
+        print(f"DRY: sha256 {os.path.basename(archive)} > {archive}.sha256")
+        return
+    with open(f"{archive}.sha256", "w", encoding="utf-8") as f:
+        f.write(f"{sha256_of(archive)}  {os.path.basename(archive)}\n")
+
+
+def verify_checksum(archive: str) -> bool:
+    """Check an existing .sha256 sidecar; True if it matches."""
+    with open(f"{archive}.sha256", encoding="utf-8") as f:
+        expected = f.read().split()[0]
+    return sha256_of(archive) == expected
+
+
+def finish_archive(part: str, out: str) -> None:
+    """Verify a freshly written .part archive and move it into place."""
+    if not CONTAINER:
+        verify_archive(part)
+    if DRY_RUN:
+        print(f"DRY: mv {part} {out}")
+    else:
+        os.replace(part, out)
+    write_checksum(out)
+
+
+def remove(path: str) -> None:
+    if DRY_RUN:
+        print(f"DRY: rm {path}")
+    elif os.path.isdir(path):
+        shutil.rmtree(path, ignore_errors=True)
+    elif os.path.exists(path):
+        os.remove(path)
+
+
+# ============================================================================
+# ZIP INSPECTION AND EXTRACTION
+# ============================================================================
+
+def zip_members(zf: zipfile.ZipFile) -> List[zipfile.ZipInfo]:
+    """File members of an open zip, from its central directory."""
+    return [info for info in zf.infolist() if not info.is_dir()]
+
+
+def readable(info: zipfile.ZipInfo) -> bool:
+    """True if zipfile itself can decompress this member."""
+    return info.compress_type in ZIPFILE_METHODS
+
+
+def single_inner_member(
+    zf: zipfile.ZipFile, info: zipfile.ZipInfo
+) -> Optional[Tuple[zipfile.ZipFile, zipfile.ZipInfo]]:
+    """
+    If `info` is a single-file zip small enough to hold in memory, return
+    (inner zip, its member) for streaming; otherwise None. The inner member
+    may still need readable() checking before it is streamed.
+    """
+    if (not info.filename.lower().endswith(".zip")
+            or info.file_size > INNER_MEMORY_LIMIT or not readable(info)):
+        return None
+    try:
+        inner = zipfile.ZipFile(BytesIO(zf.read(info)))
+    except zipfile.BadZipFile:
+        return None
+    members = zip_members(inner)
+    if len(members) != 1:
+        inner.close()
+        return None
+    return inner, members[0]
+
+
+def extract_inner_zips(top: str, recursive: bool) -> None:
+    """Extract single-file .zip files found under top, deleting them after."""
+    for root, dirs, files in os.walk(top):
+        if not recursive:
+            dirs.clear()
+        for fn in files:
+            if not fn.lower().endswith(".zip"):
+                continue
+            inner_path = os.path.join(root, fn)
+            try:
+                with zipfile.ZipFile(inner_path) as inner:
+                    if len(zip_members(inner)) != 1:
+                        continue
+                    extract_zip(inner, root)
+            except zipfile.BadZipFile:
+                continue
+            remove(inner_path)
+
+
+def extract_zip(zf: zipfile.ZipFile, dest: str) -> None:
+    """Extract an opened zip, via unzip/7za if zipfile can't decode it."""
+    if DRY_RUN:
+        print(f"DRY: extract {zf.filename} -> {dest}/")
+        return
+    os.makedirs(dest, exist_ok=True)
+    if all(readable(info) for info in zf.infolist()):
+        zf.extractall(dest)
+    elif shutil.which("unzip"):
+        rc = subprocess.call(["unzip", "-q", "-o", zf.filename, "-d", dest])
+        if rc != 0:
+            raise ArchiveError(f"unzip exited with {rc}")
+    else:
+        run_7za(["x", "-y", f"-o{dest}", zf.filename])
+
+
+def link_or_copy(src: str, dest_dir: str) -> None:
+    """Hard-link src into dest_dir, copying only if linking isn't possible."""
+    if DRY_RUN:
+        print(f"DRY: ln {src} {dest_dir}/")
+        return
+    os.makedirs(dest_dir, exist_ok=True)
+    dest = os.path.join(dest_dir, os.path.basename(src))
+    if os.path.exists(dest):
+        os.remove(dest)
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copy2(src, dest)
+
+
+# ============================================================================
+# JOURNAL
+# ============================================================================
+
+class Journal:
+    """
+    Append-only JSON-lines log of finished zips.
+
+    An entry only counts while the zip's size and mtime still match, so a
+    replaced zip is processed again.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._entries: Dict[str, Dict] = {}
+        if os.path.isfile(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # torn last line from a kill
+                    self._entries[entry["zip"]] = entry
+
+    def status(self, zip_path: str) -> Optional[str]:
+        entry = self._entries.get(os.path.basename(zip_path))
+        if entry is None:
+            return None
+        st = os.stat(zip_path)
+        if entry["size"] != st.st_size or entry["mtime"] != st.st_mtime:
+            return None
+        return entry["status"]
+
+    def record(self, zip_path: str, status: str, size: int, mtime: float) -> None:
+        if DRY_RUN:
+            return
+        entry = {"zip": os.path.basename(zip_path), "status": status,
+                 "size": size, "mtime": mtime}
+        self._entries[entry["zip"]] = entry
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def discard(self) -> None:
+        self._entries.clear()
+        if os.path.exists(self.path):
+            remove(self.path)
+
+
+# ============================================================================
+# REPACK MODE (one .7z per zip)
+# ============================================================================
+
+def _init_worker(config: Dict) -> None:
+    """Process-pool initializer: copy the parent's flag values."""
+    globals().update(config)
+
+
+def repack_one(zip_path: str, idx: int, total: int, staging_base: str) -> Tuple[str, int, int]:
+    """
+    Repack one zip. Returns (status, zip_size, 7z_size); status is
+    "done" or "skipped". Raises on failure (ArchiveError for bad zips
+    and 7za errors).
+    """
+    target_dir = os.path.dirname(zip_path)
+    name = os.path.splitext(os.path.basename(zip_path))[0]
+    out = os.path.join(target_dir, f"{name}.7z")
+    part = f"{out}.part"
+    size_before = os.path.getsize(zip_path)
+
+    if os.path.isfile(out):
+        print(f"[{idx}/{total}] {name}: skipping (already have .7z)")
+        return "skipped", 0, 0
+
+    print(f"[{idx}/{total}] {name}")
+    prefix = f"{name}/" if FOLDERED else ""
+    staging = f"{staging_base}-{os.getpid()}-{idx}"
+
+    try:
+        with zipfile.ZipFile(zip_path) as zf:
+            members = zip_members(zf)
+
+            # A single member zipfile can decode is streamed into 7za (with
+            # --unzip-inner, the member of a single-file zip nested in it);
+            # everything else goes through a staging dir.
+            member = members[0] if len(members) == 1 and readable(members[0]) else None
+            inner = None
+            if (member is not None and not SKIP_7Z and UNZIP_INNER
+                    and member.filename.lower().endswith(".zip")):
+                inner = single_inner_member(zf, member)
+                if inner is not None and not readable(inner[1]):
+                    inner[0].close()
+                    inner = member = None
+                elif inner is None and member.file_size > INNER_MEMORY_LIMIT:
+                    member = None  # too big to inspect in memory; stage it
+
+            if SKIP_7Z:
+                dest = os.path.join(target_dir, name) if FOLDERED else target_dir
+                extract_zip(zf, dest)
+                if UNZIP_INNER:
+                    extract_inner_zips(dest, recursive=False)
+            elif member is not None:
+                remove(part)
+                if inner is not None:
+                    inner_zf, inner_member = inner
+                    inner_dir = os.path.dirname(member.filename)
+                    inner_name = "/".join(filter(None, [inner_dir, inner_member.filename]))
+                    with inner_zf, inner_zf.open(inner_member) as src:
+                        pack_stream(part, prefix + inner_name, src)
+                else:
+                    with zf.open(member) as src:
+                        pack_stream(part, prefix + member.filename, src)
+                finish_archive(part, out)
+            else:
+                remove(part)
+                dest = os.path.join(staging, name) if FOLDERED else staging
+                extract_zip(zf, dest)
+                if UNZIP_INNER:
+                    extract_inner_zips(staging, recursive=True)
+                inputs = [os.path.join(staging, n) for n in sorted(os.listdir(staging))] \
+                    if not DRY_RUN else [f"{staging}/*"]
+                pack_paths(part, inputs)
+                finish_archive(part, out)
+    except zipfile.BadZipFile as e:
+        raise ArchiveError(f"{name}: {e}") from e
+    except BaseException:
+        if not DRY_RUN and os.path.exists(part):
+            os.remove(part)
+        raise
+    finally:
+        if os.path.isdir(staging):
+            shutil.rmtree(staging, ignore_errors=True)
+
+    if DELETE_ORIGINALS:
+        remove(zip_path)
+    size_after = os.path.getsize(out) if os.path.isfile(out) else 0
+    print("  Done.")
+    return "done", size_before, size_after
+
+
+def repack_all(target_dir: str, zips: List[str], journal: Journal) -> None:
+    staging_base = f"{target_dir}-staging"
+    completed = skipped = failed = 0
+    bytes_before = bytes_after = 0
+
+    pending: List[Tuple[int, str, os.stat_result]] = []
+    for idx, zip_path in enumerate(zips, 1):
+        name = os.path.splitext(os.path.basename(zip_path))[0]
+        out = os.path.join(target_dir, f"{name}.7z")
+        # A .7z deleted to force a rebuild overrides the journal.
+        if journal.status(zip_path) == "done" and (
+            SKIP_7Z or DELETE_ORIGINALS or os.path.isfile(out)
+        ):
+            skipped += 1
+            continue
+        pending.append((idx, zip_path, os.stat(zip_path)))
+    if skipped:
+        print(f"Journal: {skipped} zip(s) already done, not rescanning.")
+
+    print(f"Repacking ZIPs in: {target_dir}")
+    if PARALLEL > 1:
+        print(f"Parallel jobs: {PARALLEL}")
+    print("")
+
+    config = {name: globals()[name] for name in CONFIG_NAMES}
+    with ProcessPoolExecutor(max_workers=max(1, PARALLEL),
+                             initializer=_init_worker, initargs=(config,)) as pool:
+        futures = {
+            pool.submit(repack_one, zip_path, idx, len(zips), staging_base): (zip_path, st)
+            for idx, zip_path, st in pending
+        }
+        for future in as_completed(futures):
+            zip_path, st = futures[future]
+            try:
+                status, before, after = future.result()
+            except ArchiveError as e:
+                print(f"  WARN: {e}, skipping")
+                failed += 1
+                continue
+            except Exception as e:
+                # Disk full, permissions, ...: lose this zip, not the run.
+                print(f"  WARN: {os.path.basename(zip_path)}: "
+                      f"{type(e).__name__}: {e}, skipping")
+                failed += 1
+                continue
+            if status == "skipped":
+                skipped += 1
+                continue
+            completed += 1
+            bytes_before += before
+            bytes_after += after
+            journal.record(zip_path, "done", st.st_size, st.st_mtime)
+
+    print_summary({"Completed": completed, "Skipped": skipped, "Failed": failed},
+                  bytes_before, bytes_after)
+
+
+def resume_pack_repack(target_dir: str) -> None:
+    """--resume-pack --repack: pack each subfolder lacking a .7z."""
+    subdirs = sorted(e.path for e in os.scandir(target_dir) if e.is_dir())
+    if not subdirs:
+        print(f"No subdirectories found in {target_dir} to pack.")
+        return
+
+    print(f"Resume-packing subdirectories in: {target_dir}\n")
+    completed = skipped = 0
+    for idx, d in enumerate(subdirs, 1):
+        name = os.path.basename(d)
+        out = os.path.join(target_dir, f"{name}.7z")
+        if os.path.isfile(out):
+            print(f"[{idx}/{len(subdirs)}] {name}: skipping (already have .7z)")
+            skipped += 1
+            continue
+        print(f"[{idx}/{len(subdirs)}] {name}")
+        part = f"{out}.part"
+        remove(part)
+        pack_paths(part, [d])
+        finish_archive(part, out)
+        completed += 1
+        print("  Done.\n")
+    print(f"\nPacked {completed} subdirectories ({skipped} skipped).")
+
+
+# ============================================================================
+# MERGE MODE (all zips into <directory>.7z)
+# ============================================================================
+
+def stage_zip(zip_path: str, staging: str) -> None:
+    """Put one zip's contribution to the merged archive into staging."""
+    name = os.path.splitext(os.path.basename(zip_path))[0]
+    dest = os.path.join(staging, name) if FOLDERED else staging
+
+    if NO_UNZIP:
+        link_or_copy(zip_path, dest)
+        return
+
+    with zipfile.ZipFile(zip_path) as zf:
+        if len(zip_members(zf)) != 1 and not UNZIP_ALL:
+            print("  multi-file zip, adding as-is")
+            link_or_copy(zip_path, dest)
+        else:
+            extract_zip(zf, dest)
+    if UNZIP_INNER and not DRY_RUN:
+        extract_inner_zips(dest, recursive=True)
+
+
+def merge_all(target_dir: str, zips: List[str], out_archive: str, journal: Journal) -> None:
+    staging = f"{target_dir}-staging"
+    part = f"{out_archive}.part"
+    if os.path.exists(out_archive):
+        print(f"Error: output archive already exists: {out_archive}")
+        sys.exit(1)
+
+    print(f"Packing ZIPs from: {target_dir}")
+    print(f"Into archive     : {out_archive}\n")
+
+    bytes_before = sum(os.path.getsize(z) for z in zips)
+    extracted = skipped = 0
+    if not os.path.isdir(staging):
+        journal.discard()  # nothing staged survives from an earlier run
+    try:
+        if NO_UNZIP and CONTAINER:
+            # Fast path: no extraction needed, add zips directly.
+            print(f"Adding {len(zips)} zips directly (no-unzip + container)...")
+            remove(part)
+            pack_paths(part, zips)
+            extracted = len(zips)
+        else:
+            if not DRY_RUN:
+                os.makedirs(staging, exist_ok=True)
+            already = sum(journal.status(z) == "staged" for z in zips)
+            if already:
+                print(f"Journal: {already} zip(s) already staged, not rescanning.")
+            for idx, zip_path in enumerate(zips, 1):
+                name = os.path.splitext(os.path.basename(zip_path))[0]
+                if journal.status(zip_path) == "staged":
+                    extracted += 1
+                    continue
+                print(f"[{idx}/{len(zips)}] {name}")
+                try:
+                    stage_zip(zip_path, staging)
+                except Exception as e:
+                    print(f"  WARN: failed to extract ({e}), skipping")
+                    skipped += 1
+                    continue
+                st = os.stat(zip_path)
+                journal.record(zip_path, "staged", st.st_size, st.st_mtime)
+                extracted += 1
+
+            print(f"\nCompressing into {out_archive} ...")
+            remove(part)
+            inputs = [os.path.join(staging, n) for n in sorted(os.listdir(staging))] \
+                if not DRY_RUN else [f"{staging}/*"]
+            pack_paths(part, inputs)
+
+        if CONTAINER:
+            print("\nSkipping verification (container mode, no compression).")
+        else:
+            print("\nVerifying...")
+        finish_archive(part, out_archive)
+    except BaseException:
+        if not DRY_RUN and os.path.exists(part):
+            os.remove(part)
+            print(f"\nRemoved partial archive: {part}")
+        if os.path.isdir(staging):
+            print(f"Staging kept at {staging}; re-run to continue where it stopped.")
+        print("Original ZIPs were preserved.")
+        raise
+
+    remove(staging)
+    journal.discard()
+
+    if DELETE_ORIGINALS:
+        print("\nDeleting original ZIPs...")
+        for zip_path in zips:
+            remove(zip_path)
+
+    size_after = os.path.getsize(out_archive) if os.path.isfile(out_archive) else 0
+    print_summary({"Extracted": extracted, "Skipped": skipped}, bytes_before, size_after)
+
+
+def resume_pack_merge(target_dir: str, out_archive: str) -> None:
+    """--resume-pack in merge mode: pack the staging dir left by a prior run."""
+    staging = f"{target_dir}-staging"
+    if not os.path.isdir(staging):
+        print(f"Error: no staging dir found at {staging}")
+        print("Nothing to resume.")
+        sys.exit(1)
+    if os.path.exists(out_archive):
+        print(f"Error: output archive already exists: {out_archive}")
+        sys.exit(1)
+
+    print(f"Resume-packing staging dir into: {out_archive}")
+    part = f"{out_archive}.part"
+    remove(part)
+    pack_paths(part, [os.path.join(staging, n) for n in sorted(os.listdir(staging))])
+    finish_archive(part, out_archive)
+    remove(staging)
+    Journal(f"{staging}.journal.jsonl").discard()
+    print("\nDone.")
+
+
+# ============================================================================
+# VERIFY-ONLY
+# ============================================================================
+
+def verify_all(target_dir: str) -> None:
+    archives = sorted(e.path for e in os.scandir(target_dir)
+                      if e.is_file() and e.name.endswith(".7z"))
+    if not archives:
+        print(f"No .7z files found in {target_dir}")
+        return
+
+    print(f"Verifying {len(archives)} archive(s) in: {target_dir}\n")
+    failed = 0
+    for idx, archive in enumerate(archives, 1):
+        print(f"[{idx}/{len(archives)}] {os.path.basename(archive)}")
+        try:
+            verify_archive(archive)
+        except ArchiveError:
+            print("  FAIL: archive integrity check failed")
+            failed += 1
+            continue
+        if CHECKSUM and os.path.isfile(f"{archive}.sha256"):
+            if not DRY_RUN and not verify_checksum(archive):
+                print("  FAIL: sha256 mismatch")
+                failed += 1
+        elif CHECKSUM:
+            print("  WARN: no .sha256 sidecar to verify")
+
+    print(f"\nVerified {len(archives) - failed}/{len(archives)} archives ({failed} failed).")
+    if failed:
+        sys.exit(1)
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def human(n: float) -> str:
+    """Format a byte count like numfmt --to=iec-i --suffix=B."""
+    for unit in ["B", "KiB", "MiB", "GiB"]:
+        if abs(n) < 1024:
+            return f"{n:.1f}{unit}"
+        n /= 1024
+    return f"{n:.1f}TiB"
+
+
+def print_summary(counts: Dict[str, int], bytes_before: int, bytes_after: int) -> None:
+    print("")
+    print("=" * 38)
+    print("  Summary")
+    print("=" * 38)
+    for label, value in counts.items():
+        print(f"  {label:<12}: {value}")
+    if bytes_before:
+        print(f"  {'ZIPs size':<12}: {human(bytes_before)}")
+    if bytes_after:
+        print(f"  {'7z size':<12}: {human(bytes_after)}")
+        if bytes_before:
+            saved = bytes_before - bytes_after
+            print(f"  {'Saved':<12}: {human(saved)}")
+            print(f"  {'Reduction':<12}: {saved * 100 / bytes_before:.1f}%")
+    print("=" * 38)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Unzip, merge, and repack files for archival using 7zip "
+                    "(Python engine for archive-helper.sh; same options)."
+    )
+    flags = {
+        "--unzip-all": "Extract all zips, including multi-file ones",
+        "--container": "Store only, no compression (-mx=0)",
+        "--no-unzip": "Add every zip as-is",
+        "--foldered": "Give each zip its own folder in the archive",
+        "--unzip-inner": "Also extract single-file zips found inside zips",
+        "--delete-originals": "Delete source zips after success",
+        "--repack": "One .7z per zip instead of one merged archive",
+        "--skip-7z": "Only extract zips (implies --repack)",
+        "--resume-pack": "Pack pre-extracted content (see archive-helper.sh)",
+        "--dry-run": "Print what would happen without writing anything",
+        "--verify-only": "Test every .7z in the directory",
+        "--checksum": "Write/verify .sha256 sidecars",
+    }
+    for flag, help_text in flags.items():
+        parser.add_argument(flag, action="store_true", help=help_text)
+    parser.add_argument("--no-solid", action="store_true", help="Disable solid mode")
+    parser.add_argument("--level", type=int, default=LEVEL,
+                        help="Compression level 0-9 (default: %(default)s)")
+    parser.add_argument("--dict", default=DICT,
+                        help="Dictionary size, e.g. 64m, 1g (default: %(default)s)")
+    parser.add_argument("--password", default=PASSWORD,
+                        help="Encrypt archives (with -mhe=on)")
+    parser.add_argument("--parallel", type=int, default=PARALLEL,
+                        help="Repack jobs run in parallel (default: %(default)s)")
+    parser.add_argument("directory", help="Directory of .zip files")
+    return parser.parse_args()
+
+
+def main() -> None:
+    global UNZIP_ALL, CONTAINER, NO_UNZIP, FOLDERED, UNZIP_INNER, DELETE_ORIGINALS
+    global REPACK, SKIP_7Z, RESUME_PACK, LEVEL, DICT, SOLID, DRY_RUN
+    global VERIFY_ONLY, PASSWORD, CHECKSUM, PARALLEL
+
+    args = parse_args()
+    UNZIP_ALL        = args.unzip_all
+    CONTAINER        = args.container
+    NO_UNZIP         = args.no_unzip
+    FOLDERED         = args.foldered
+    UNZIP_INNER      = args.unzip_inner
+    DELETE_ORIGINALS = args.delete_originals
+    REPACK           = args.repack or args.skip_7z
+    SKIP_7Z          = args.skip_7z
+    RESUME_PACK      = args.resume_pack
+    LEVEL            = args.level
+    DICT             = args.dict
+    SOLID            = "off" if args.no_solid else "on"
+    DRY_RUN          = args.dry_run
+    VERIFY_ONLY      = args.verify_only
+    PASSWORD         = args.password
+    CHECKSUM         = args.checksum
+    PARALLEL         = args.parallel
+
+    target_dir = args.directory.rstrip("/\\") or "."
+    if not os.path.isdir(target_dir):
+        print(f"Error: '{target_dir}' is not a directory")
+        sys.exit(1)
+    out_archive = os.path.join(os.path.dirname(target_dir) or ".",
+                               f"{os.path.basename(target_dir)}.7z")
+
+    if VERIFY_ONLY:
+        verify_all(target_dir)
+        return
+    if RESUME_PACK:
+        if REPACK:
+            resume_pack_repack(target_dir)
+        else:
+            resume_pack_merge(target_dir, out_archive)
+        return
+
+    zips = sorted(e.path for e in os.scandir(target_dir)
+                  if e.is_file() and e.name.endswith(".zip"))
+    if not zips:
+        print(f"No .zip files found in {target_dir}")
+        return
+
+    try:
+        if REPACK:
+            repack_all(target_dir, zips, Journal(f"{target_dir}.journal.jsonl"))
+        else:
+            merge_all(target_dir, zips, out_archive,
+                      Journal(f"{target_dir}-staging.journal.jsonl"))
+    except ArchiveError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        print("\nInterrupted; re-run the same command to resume.")
+        sys.exit(130)
+    print("\nDone.")
+
+
+if __name__ == "__main__":
+    main()
@@ -75,6 +75,11 @@
 #   --parallel N  In --repack mode, run up to N repack jobs in parallel.
 #                Each job uses its own staging dir. Has no effect in merge
 #                mode (7za already parallelizes internally).
+#   --python     Run archive-helper.py instead, with the same options. It
+#                classifies zips from their central directory, streams
+#                single-file zips straight into 7za (no staging), hard-links
+#                as-is zips into staging, and journals progress so an
+#                interrupted run resumes without rescanning finished zips.
 #
 # Example:
 #   ./archive-helper.sh "./Nintendo DS unmodified"
@@ -87,6 +92,16 @@
 
 set -euo pipefail
 
+for arg in "$@"; do
+    if [[ "$arg" == "--python" ]]; then
+        args=()
+        for a in "$@"; do
+            [[ "$a" != "--python" ]] && args+=("$a")
+        done
+        exec python3 "$(dirname "$0")/archive-helper.py" "${args[@]}"
+    fi
+done
+
 UNZIP_ALL=0
 CONTAINER=0
 NO_UNZIP=0
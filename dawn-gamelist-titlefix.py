@@ -8,6 +8,10 @@ gamelist path of "./PacMania.zip" still matches a JSON RomName of "pacmania.zip"
 
 Output is rewritten as compact (single-line) JSON.
 
+When the gamelists come from launchbox-export.py, running the exporter
+with ``--outputs gamelist,dawn --dawn-json Games.json`` applies the same
+fix during the export, without re-parsing the gamelists.
+
 Expected layout::
 
     <platforms_root>/Games.json
@@ -1,7 +1,8 @@
 """
 Export LaunchBox game metadata and media into a Batocera-compatible tree.
 
-Requirements: Python 3.9+ and Pillow (pip install Pillow)
+Requirements: Python 3.9+ and Pillow (pip install Pillow); Pillow is only
+imported when images are actually processed.
 
 For each platform listed in PLATFORMS, parses LaunchBox's platform XML,
 copies the matching box art / screenshot / marquee / video / manual (and
@@ -33,11 +34,23 @@ in kebab-case, e.g. COPY_ROMS <-> --copy-roms / --no-copy-roms):
                     plus media folders.
     COPY_ROMS       Copy ROM files alongside the metadata. Off by default
                     because ROMs can be huge; usually you only want the
-                    metadata + art.
+                    metadata + art. ROMs are hashed (CRC32 + SHA1) as
+                    they stream and recorded in <platform>/checksums.json;
+                    unchanged ROMs are skipped on later runs and .lpl
+                    playlists carry the real CRC instead of DETECT.
+    VERIFY_ROMS     After each ROM copy, re-read the destination and
+                    check its CRC32 and SHA1 against the copy-time hashes.
+                    Off by default: it doubles the I/O of every copied ROM
+                    (size is always checked).
     COPY_MEDIA      Actually write media files to disk. If False,
                     gamelist.xml still references the expected paths,
                     which is useful when re-running after media was
                     already copied on a previous pass.
+    METADATA_ONLY   Fast refresh of gamelist text only (ratings, notes,
+                    ...): LaunchBox media folders are not indexed, nothing
+                    is copied, and each game references only the media
+                    files already present in its output folders (one
+                    scandir per folder). Implies no media or ROM copying.
     CONVERT_TO_PNG  Convert .jpg/.jpeg sources to .png in the output and
                     keep any transparency. Marquees always save as PNG
                     regardless of this flag.
@@ -46,10 +59,71 @@ in kebab-case, e.g. COPY_ROMS <-> --copy-roms / --no-copy-roms):
                     refreshes. Games with missing or unparseable
                     DateAdded are skipped and counted in the final summary.
     RECENT_DAYS     Window size in days for RECENTS_ONLY mode.
-    WORKERS         Thread-pool size for per-game processing. Work is
-                    I/O-bound (disk copies + PIL encode), so values above
-                    CPU count can still help until the output disk
-                    saturates.
+    OUTPUTS         Which frontends to write, all from the same parse and
+                    media pass: "gamelist" (ES/Batocera gamelist.xml),
+                    "lpl" (RetroArch playlist per platform, path style
+                    LPL_PLATFORM as in lpl-helper.sh, written to LPL_DIR,
+                    default <OUTPUT_DIR>/playlists, labels = ROM
+                    basenames unless LPL_TITLE_LABELS) and "dawn" (patches
+                    titles into Dawn's Games.json at DAWN_JSON, as
+                    dawn-gamelist-titlefix.py does).
+    LPL_TITLE_LABELS  Label .lpl entries with the game title instead of
+                    the ROM basename. RetroArch looks thumbnails up by
+                    label, so this only suits thumbnails named by title.
+    WATCH           Keep running after startup and re-export games as
+                    they change: platform XMLs and the media source
+                    folders are watched with inotify (polling where
+                    inotify isn't available, e.g. Windows or SMB mounts),
+                    only the affected games are re-processed, and
+                    every output is updated (gamelist.xml is patched in
+                    place). Run a normal export first; RECENTS_ONLY is
+                    ignored in this mode.
+    WATCH_DEBOUNCE  Seconds without a new change before a burst of
+                    changes is processed.
+    WATCH_POLL_INTERVAL  Seconds between scans in polling fallback.
+    REPORT_PATH     JSON report written once at the end of an export:
+                    per platform, the games missing each essential media
+                    type, processing failures and fallback copies (default
+                    <OUTPUT_DIR>/export-report.json). Workers no longer
+                    print per game; the console shows totals instead.
+                    Not written in WATCH mode, where each refresh prints
+                    its failures and fallback copies directly.
+    PROGRESS_INTERVAL  Minimum seconds between console progress lines.
+    SNAPSHOT        After the export, write <OUTPUT_DIR>/export-manifest.json
+                    listing every output file with its size and SHA1.
+                    Files unchanged since the last snapshot (same size
+                    and mtime) aren't re-hashed.
+    BASELINE        What an offline device currently has: a manifest file,
+                    or a directory holding a copy of the export (its
+                    export-manifest.json is used if present, otherwise
+                    the copy is hashed). Default with DELTA_DIR: the
+                    manifest left by the previous --snapshot/--delta-dir run.
+    DELTA_DIR       Write a delta bundle from BASELINE to this export:
+                    only new and changed files, a deletions.txt list, the
+                    new manifest and an apply.sh to run on the device
+                    (sh apply.sh /userdata/roms). Implies SNAPSHOT.
+    WORKERS         Threads writing to the output disk. Media flows
+                    through three stages (source prefetch, PIL transform,
+                    write), each with its own thread count, joined by
+                    queues holding at most PIPELINE_BUFFER_MB of file data
+                    so slow share reads overlap with encoding and writes.
+    PREFETCH_WORKERS   Concurrent reads from the LaunchBox folders. Raise
+                    for high-latency SMB/NFS shares.
+    TRANSFORM_WORKERS  Concurrent image decodes/encodes (default: CPUs).
+    PIPELINE_BUFFER_MB Byte budget of each inter-stage queue; producers
+                    block when it is full.
+    DECODE_BUDGET_MB   Pixel memory that concurrent image decodes may
+                    hold, estimated from each image's header before it is
+                    decoded. Huge sources (4K screenshots, 8000px logos)
+                    wait their turn, or run alone if bigger than the
+                    budget, while small ones keep flowing. 0 = no limit.
+    ADAPTIVE_WORKERS  Treat WORKERS as a ceiling and let the exporter find
+                    the throughput peak: completed bytes per second are
+                    measured every ADAPTIVE_WINDOW seconds and the number
+                    of concurrent output writes is stepped up or down until it
+                    settles (logged per platform). Slow targets such as
+                    SD-card readers usually settle at 2-3.
+    ADAPTIVE_WINDOW Seconds per throughput measurement.
     PLATFORMS       {LaunchBox platform name: Batocera output folder}.
                     Uncomment the entries you want to export.
 
@@ -57,15 +131,28 @@ Run with -h for the full CLI flag list.
 """
 
 import argparse
+import bisect
+import ctypes
+import ctypes.util
+import errno
+import hashlib
+import io
+import json
 import os
+import queue
+import select
+import struct
+import sys
+import threading
+import time
 import traceback
+import zlib
 import xml.etree.ElementTree as ET
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from shutil import copy
-from typing import Dict, List, Optional, Tuple
-
-from PIL import Image
+from shutil import copy, copy2, copymode, rmtree
+from typing import BinaryIO, Callable, Dict, List, Optional, Set, Tuple, Union
 
 
 # ============================================================================
@@ -76,11 +163,32 @@ LB_DIR = r'R:\Games\LaunchBox'
 OUTPUT_DIR = r'R:\Launchbox-Export'
 
 COPY_ROMS = False
+VERIFY_ROMS = False
 COPY_MEDIA = True
+METADATA_ONLY = False
 CONVERT_TO_PNG = True
 RECENTS_ONLY = False
 RECENT_DAYS = 7
 WORKERS = 8
+ADAPTIVE_WORKERS = True
+ADAPTIVE_WINDOW = 3.0
+PREFETCH_WORKERS = 8
+TRANSFORM_WORKERS = os.cpu_count() or 4
+PIPELINE_BUFFER_MB = 256
+DECODE_BUDGET_MB = 1024
+OUTPUTS = ["gamelist"]
+LPL_PLATFORM = "linux"
+LPL_DIR = ""
+LPL_TITLE_LABELS = False
+DAWN_JSON = ""
+WATCH = False
+WATCH_DEBOUNCE = 2.0
+WATCH_POLL_INTERVAL = 5.0
+REPORT_PATH = ""
+PROGRESS_INTERVAL = 2.0
+SNAPSHOT = False
+BASELINE = ""
+DELTA_DIR = ""
 
 PLATFORMS = {
     # Uncomment platforms you want to export:
@@ -161,6 +269,13 @@ MEDIA_MAPPINGS = [
 
 ESSENTIAL_MEDIA_OUTPUTS = {"covers", "screenshots", "marquees"}
 
+# Every gamelist.xml field this exporter writes. Used when patching an
+# existing gamelist so fields added by frontends are left alone.
+GAMELIST_FIELDS = {
+    "path", "name", "rating", "releasedate", "developer", "publisher",
+    "genre", "desc", "players",
+} | {mapping["xmltag"] for mapping in MEDIA_MAPPINGS}
+
 
 # ============================================================================
 # UTILITY FUNCTIONS
@@ -185,28 +300,31 @@ def list_media_files(media_dir: str) -> List[str]:
     return files
 
 
-def build_media_lookup(media_files: List[str]) -> Dict[str, str]:
+def media_lookup_key(filepath: str) -> str:
     """
-    Build a {lowercased_game_name_stem -> filepath} map for O(1) lookup.
+    Return the lowercased game-name key a media file is indexed under.
 
     Handles LaunchBox's numbered-variant suffix (e.g. Game-01.png,
     Game-02.png, Game-09.jpg) by stripping a trailing "-0N" from the
-    stem before indexing, which mirrors the old startswith("name-0")
-    matching behavior. First file wins when multiple variants share
-    a stem, so sort the input for determinism.
+    stem, which mirrors the old startswith("name-0") matching behavior.
     """
-    lookup: Dict[str, str] = {}
-    for filepath in sorted(media_files):
-        filename = os.path.basename(filepath)
-        stem, _ = os.path.splitext(filename)
+    stem, _ = os.path.splitext(os.path.basename(filepath))
+    dash_idx = stem.rfind("-0")
+    if 0 <= dash_idx < len(stem) - 2:
+        return stem[:dash_idx].lower()
+    return stem.lower()
 
-        dash_idx = stem.rfind("-0")
-        if 0 <= dash_idx < len(stem) - 2:
-            key = stem[:dash_idx].lower()
-        else:
-            key = stem.lower()
 
-        lookup.setdefault(key, filepath)
+def build_media_lookup(media_files: List[str]) -> Dict[str, str]:
+    """
+    Build a {lowercased_game_name_stem -> filepath} map for O(1) lookup.
+
+    First file wins when multiple variants share a key (see
+    media_lookup_key), so sort the input for determinism.
+    """
+    lookup: Dict[str, str] = {}
+    for filepath in sorted(media_files):
+        lookup.setdefault(media_lookup_key(filepath), filepath)
     return lookup
 
 
@@ -227,7 +345,54 @@ def parse_date_added(date_str: str) -> Optional[datetime]:
         return None
 
 
-def is_game_recent(game_element: ET.Element, cutoff_date: datetime) -> Tuple[bool, bool]:
+class GameRecord:
+    """
+    The fields of one LaunchBox <Game> the exporter uses, decoded once.
+
+    Slotted so a queued platform costs a few pointers per game instead of
+    a full ElementTree subtree. Missing fields are None.
+    """
+
+    __slots__ = (
+        "title", "rom_path", "star_rating", "release_date", "developer",
+        "publisher", "genre", "notes", "max_players", "date_added",
+    )
+
+    def __init__(self) -> None:
+        for slot in self.__slots__:
+            setattr(self, slot, None)
+
+    def fingerprint(self) -> Tuple[Optional[str], ...]:
+        """Every decoded field, for cheap change detection in watch mode."""
+        return tuple(getattr(self, slot) for slot in self.__slots__)
+
+
+# {<Game> child tag: GameRecord attribute}. Tags not listed are skipped.
+GAME_FIELDS = {
+    "Title":           "title",
+    "ApplicationPath": "rom_path",
+    "StarRating":      "star_rating",
+    "ReleaseDate":     "release_date",
+    "Developer":       "developer",
+    "Publisher":       "publisher",
+    "Genre":           "genre",
+    "Notes":           "notes",
+    "MaxPlayers":      "max_players",
+    "DateAdded":       "date_added",
+}
+
+
+def decode_game(game_elem: ET.Element) -> GameRecord:
+    """Walk a <Game>'s children once, dispatching on tag via GAME_FIELDS."""
+    record = GameRecord()
+    for child in game_elem:
+        attr = GAME_FIELDS.get(child.tag)
+        if attr is not None:
+            setattr(record, attr, child.text)
+    return record
+
+
+def is_game_recent(record: GameRecord, cutoff_date: datetime) -> Tuple[bool, bool]:
     """
     Return (is_recent, has_parseable_date).
 
@@ -235,37 +400,92 @@ def is_game_recent(game_element: ET.Element, cutoff_date: datetime) -> Tuple[boo
     "skipped because no DateAdded metadata exists" so the latter can be
     reported in the final summary.
     """
-    date_elem = game_element.find("DateAdded")
-    if date_elem is None or not date_elem.text:
+    if not record.date_added:
         return False, False
 
-    added_date = parse_date_added(date_elem.text)
+    added_date = parse_date_added(record.date_added)
     if added_date is None:
         return False, False
 
     return added_date >= cutoff_date, True
 
 
-def process_image(img_path: str, output_path: str, media_type: str) -> None:
-    """Process and save an image. Marquees get trimmed; others optionally convert to PNG."""
-    with Image.open(img_path) as img:
-        ext = os.path.splitext(img_path)[1].lower()
+def load_game_records(
+    xml_path: str,
+    cutoff_date: Optional[datetime] = None,
+) -> Tuple[List[GameRecord], int, int]:
+    """
+    Stream a platform XML into GameRecords.
 
-        if media_type == "marquee":
-            bbox = img.getbbox()
-            if bbox:
-                img = img.crop(bbox)
-            img.save(output_path, format="PNG")
-            return
+    Returns (records, total_games, skipped_no_date). The DateAdded filter
+    is applied as each game is decoded, and each <Game> element is freed
+    right after, so the parsed tree never outlives its game. Games with
+    no Title or ApplicationPath are dropped here. Raises ET.ParseError
+    and OSError like ET.parse.
+    """
+    records: List[GameRecord] = []
+    total_games = 0
+    skipped_no_date = 0
+    root: Optional[ET.Element] = None
 
-        if CONVERT_TO_PNG and ext in [".jpg", ".jpeg", ".png"]:
-            if 'A' in img.getbands():
-                img = img.convert("RGBA")
+    for event, elem in ET.iterparse(xml_path, events=("start", "end")):
+        if root is None:
+            root = elem
+        if event != "end" or elem.tag != "Game":
+            continue
+
+        total_games += 1
+        record = decode_game(elem)
+        root.clear()
+
+        if cutoff_date is not None:
+            is_recent, has_date = is_game_recent(record, cutoff_date)
+            if not has_date:
+                skipped_no_date += 1
+                continue
+            if not is_recent:
+                continue
+        if record.rom_path and record.title:
+            records.append(record)
+
+    return records, total_games, skipped_no_date
+
+
+def process_image(source: Union[str, BinaryIO], ext: str, media_type: str) -> bytes:
+    """
+    Process an image and return the encoded output bytes.
+
+    Marquees get trimmed; others optionally convert to PNG. `source` is
+    a path or an in-memory file (prefetched by MediaPipeline); `ext` is
+    the source extension. Decoding waits for room in DECODE_BUDGET_MB.
+    """
+    # Imported here so metadata-only runs never load Pillow.
+    from PIL import Image
+
+    out = io.BytesIO()
+    with Image.open(source) as img:
+        source_format = img.format
+        # Image.open has only read the header; reserve memory before decoding.
+        reserved = _decode_budget.acquire(estimate_decode_bytes(img, ext, media_type))
+        try:
+            if media_type == "marquee":
+                bbox = img.getbbox()
+                if bbox:
+                    img = img.crop(bbox)
+                img.save(out, format="PNG")
+                return out.getvalue()
+
+            if CONVERT_TO_PNG and ext in [".jpg", ".jpeg", ".png"]:
+                if 'A' in img.getbands():
+                    img = img.convert("RGBA")
+                else:
+                    img = img.convert("RGB")
+                img.save(out, format="PNG")
             else:
-                img = img.convert("RGB")
-            img.save(output_path, format="PNG")
-        else:
-            img.save(output_path)
+                img.save(out, format=source_format)
+        finally:
+            _decode_budget.release(reserved)
+    return out.getvalue()
 
 
 def save_media_file(
@@ -273,14 +493,19 @@ def save_media_file(
     output_dir: str,
     rom_basename: str,
     media_type: str,
+    pipeline: "MediaPipeline",
+    game_data: Dict[str, str],
+    xmltag: str,
 ) -> str:
     """
-    Copy and process a media file and return its path relative to the
-    platform directory (for embedding into gamelist.xml).
-
-    When COPY_MEDIA is False no file is written, but the expected path
-    is still returned so gamelist.xml can reference media that was
-    copied on a previous run.
+    Queue a media file on the pipeline and return its path relative to
+    the platform directory (for embedding into gamelist.xml).
+
+    If the image can't be processed, the pipeline copies the raw source
+    instead and rewrites game_data[xmltag] to match, so read game_data
+    only after pipeline.close(). When COPY_MEDIA is False no file is
+    written, but the expected path is still returned so gamelist.xml can
+    reference media that was copied on a previous run.
     """
     ext = os.path.splitext(source_path)[1].lower()
     is_image = ext in [".jpg", ".jpeg", ".png"]
@@ -292,54 +517,45 @@ def save_media_file(
     if not COPY_MEDIA:
         return rel_path
 
-    os.makedirs(output_dir, exist_ok=True)
-    output_path = os.path.join(output_dir, new_filename)
-
-    try:
-        if is_image:
-            process_image(source_path, output_path, media_type)
-        else:
-            copy(source_path, output_path)
-    except Exception as e:
-        print(f"  Warning: Failed to process {source_path}: {e}")
-        # Fallback: raw copy preserving the SOURCE extension so we don't
-        # end up with raw JPEG bytes inside a .png file.
-        fallback_filename = f"{rom_basename}{ext}"
-        fallback_path = os.path.join(output_dir, fallback_filename)
-        try:
-            copy(source_path, fallback_path)
-            rel_path = f"./{os.path.basename(output_dir)}/{fallback_filename}"
-        except Exception as e2:
-            print(f"  Error: Fallback copy also failed: {e2}")
-
+    pipeline.submit({
+        "kind":       "image" if is_image else "file",
+        "source":     source_path,
+        "ext":        ext,
+        "media_type": media_type,
+        "output_dir": output_dir,
+        "filename":   new_filename,
+        # Fallback keeps the SOURCE extension so we don't end up with raw
+        # JPEG bytes inside a .png file.
+        "fallback":   f"{rom_basename}{ext}",
+        "game_data":  game_data,
+        "xmltag":     xmltag,
+    })
     return rel_path
 
 
-def extract_game_metadata(game_elem: ET.Element) -> Dict[str, str]:
-    """Extract metadata fields from a game XML element."""
+def extract_game_metadata(record: GameRecord) -> Dict[str, str]:
+    """Extract gamelist.xml metadata fields from a decoded game."""
     metadata: Dict[str, str] = {}
 
-    if (rating_elem := game_elem.find("StarRating")) is not None:
-        try:
-            metadata["rating"] = str(int(rating_elem.text) * 2 / 10)
-        except (ValueError, TypeError):
-            pass
-
-    if (release_elem := game_elem.find("ReleaseDate")) is not None and release_elem.text:
-        metadata["releasedate"] = release_elem.text.replace("-", "").split("T")[0] + "T000000"
-
-    xml_to_key = {
-        "Developer": "developer",
-        "Publisher": "publisher",
-        "Genre":     "genre",
-        "Notes":     "desc",
-    }
-    for xml_tag, key in xml_to_key.items():
-        if (elem := game_elem.find(xml_tag)) is not None and elem.text:
-            metadata[key] = elem.text
-
-    if (players_elem := game_elem.find("MaxPlayers")) is not None and players_elem.text:
-        mp = players_elem.text
+    try:
+        metadata["rating"] = str(int(record.star_rating) * 2 / 10)
+    except (ValueError, TypeError):
+        pass
+
+    if record.release_date:
+        metadata["releasedate"] = record.release_date.replace("-", "").split("T")[0] + "T000000"
+
+    for key, value in (
+        ("developer", record.developer),
+        ("publisher", record.publisher),
+        ("genre",     record.genre),
+        ("desc",      record.notes),
+    ):
+        if value:
+            metadata[key] = value
+
+    if record.max_players:
+        mp = record.max_players
         metadata["players"] = "1+" if mp.startswith("0") else mp
 
     return metadata
@@ -355,8 +571,988 @@ def write_gamelist_xml(games: List[Dict[str, str]], output_path: str) -> None:
             child.text = value
 
     ET.indent(root, space="    ")
-    with open(output_path, "w", encoding="utf-8") as f:
+    # Write beside the target and swap it in, so a frontend (or a device
+    # reading over the share) never sees a half-written gamelist.xml.
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
         f.write(ET.tostring(root, encoding="unicode"))
+    os.replace(tmp_path, output_path)
+
+
+def read_gamelist_xml(xml_path: str) -> List[Dict[str, str]]:
+    """Read a gamelist.xml back into the list-of-dicts form write_gamelist_xml takes."""
+    games: List[Dict[str, str]] = []
+    for game_elem in ET.parse(xml_path).getroot().iter("game"):
+        games.append({child.tag: child.text or "" for child in game_elem})
+    return games
+
+
+def patch_gamelist_xml(
+    xml_path: str,
+    updated: Dict[str, Dict[str, str]],
+    removed: Set[str],
+) -> List[Dict[str, str]]:
+    """
+    Patch an existing gamelist.xml in place, keyed by each game's <path>.
+
+    Entries in `updated` replace every field this exporter owns on the
+    matching game (fields added by frontends, e.g. playcount, survive);
+    unmatched entries are appended. Games whose path is in `removed` are
+    dropped. Untouched games keep their order. Returns the patched list.
+    """
+    games = read_gamelist_xml(xml_path) if os.path.isfile(xml_path) else []
+    pending = dict(updated)
+
+    patched: List[Dict[str, str]] = []
+    for game_data in games:
+        path = game_data.get("path", "")
+        if path in removed:
+            continue
+        if path in pending:
+            merged = {k: v for k, v in game_data.items() if k not in GAMELIST_FIELDS}
+            merged.update(pending.pop(path))
+            game_data = merged
+        patched.append(game_data)
+    patched.extend(pending.values())
+
+    write_gamelist_xml(patched, xml_path)
+    return patched
+
+
+# ============================================================================
+# ROM COPY AND CHECKSUMS
+# ============================================================================
+#
+# ROMs are streamed through CRC32 + SHA1 while they are copied, so the
+# hashes cost no extra read of the (often multi-GB) source. Results go to
+# a checksums.json sidecar in the platform folder:
+#     {rom_name: {"size", "mtime", "crc32", "sha1"}}
+# which the lpl sink uses instead of "DETECT" and which lets the next run
+# skip ROMs whose source size/mtime haven't changed.
+
+ROM_INDEX_NAME = "checksums.json"
+COPY_CHUNK_SIZE = 4 * 1024 * 1024
+
+_rom_indexes: Dict[str, Dict[str, Dict]] = {}
+_rom_index_lock = threading.Lock()
+
+
+def load_rom_index(output_platform_dir: str) -> Dict[str, Dict]:
+    """Read a platform's checksums.json sidecar ({} if absent or unreadable)."""
+    try:
+        with open(os.path.join(output_platform_dir, ROM_INDEX_NAME), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _rom_index(output_platform_dir: str) -> Dict[str, Dict]:
+    """Return the in-memory index for a platform, loading it on first use."""
+    with _rom_index_lock:
+        if output_platform_dir not in _rom_indexes:
+            _rom_indexes[output_platform_dir] = load_rom_index(output_platform_dir)
+        return _rom_indexes[output_platform_dir]
+
+
+def save_rom_index(output_platform_dir: str) -> None:
+    """Write a platform's checksum index back to its sidecar, if one was used."""
+    with _rom_index_lock:
+        index = _rom_indexes.pop(output_platform_dir, None)
+    if not index:
+        return
+    index_path = os.path.join(output_platform_dir, ROM_INDEX_NAME)
+    tmp_path = f"{index_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2, sort_keys=True, ensure_ascii=False)
+    os.replace(tmp_path, index_path)
+
+
+def _checksums_file(path: str) -> Tuple[int, str]:
+    """Return (CRC32, SHA1 hex digest) of a file, read once."""
+    crc = 0
+    sha1 = hashlib.sha1()
+    with open(path, "rb") as f:
+        while chunk := f.read(COPY_CHUNK_SIZE):
+            crc = zlib.crc32(chunk, crc)
+            sha1.update(chunk)
+    return crc, sha1.hexdigest()
+
+
+def copy_rom(rom_path: str, output_platform_dir: str) -> int:
+    """
+    Copy a ROM into the platform folder, hashing it in the same pass.
+
+    Skips the copy when the sidecar says this exact source (size + mtime)
+    is already in place. The copy lands in a .part file that is checked
+    for size and, with VERIFY_ROMS, re-read for CRC32 + SHA1 before it
+    replaces the destination. Returns bytes copied; raises OSError on
+    failure.
+    """
+    rom_name = os.path.basename(rom_path)
+    dst_path = os.path.join(output_platform_dir, rom_name)
+    index = _rom_index(output_platform_dir)
+
+    src_stat = os.stat(rom_path)
+    known = index.get(rom_name)
+    if (known is not None
+            and known["size"] == src_stat.st_size
+            and known["mtime"] == src_stat.st_mtime
+            and os.path.isfile(dst_path)
+            and os.path.getsize(dst_path) == src_stat.st_size):
+        return 0
+
+    crc = 0
+    sha1 = hashlib.sha1()
+    size = 0
+    part_path = f"{dst_path}.part"
+    try:
+        with open(rom_path, "rb") as src, open(part_path, "wb") as dst:
+            while chunk := src.read(COPY_CHUNK_SIZE):
+                crc = zlib.crc32(chunk, crc)
+                sha1.update(chunk)
+                dst.write(chunk)
+                size += len(chunk)
+
+        dst_size = os.path.getsize(part_path)
+        if dst_size != size:
+            raise OSError(f"size mismatch after copy ({dst_size} != {size})")
+        if VERIFY_ROMS and _checksums_file(part_path) != (crc, sha1.hexdigest()):
+            raise OSError("CRC32/SHA1 mismatch after copy")
+
+        copymode(rom_path, part_path)
+        os.replace(part_path, dst_path)
+    except BaseException:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        raise
+
+    with _rom_index_lock:
+        index[rom_name] = {
+            "size":  size,
+            "mtime": src_stat.st_mtime,
+            "crc32": f"{crc:08X}",
+            "sha1":  sha1.hexdigest(),
+        }
+    return size
+
+
+# ============================================================================
+# OUTPUT SINKS
+# ============================================================================
+#
+# Every sink consumes the same in-memory game records (the gamelist.xml
+# field dicts built by process_game), so a platform is parsed and its
+# media resolved once no matter how many frontends are written. A sink is
+# a per-platform writer plus an optional "finish" hook that runs once
+# after all platforms (for outputs that span platforms, like Dawn).
+
+# RetroArch ROM path styles, mirroring platform_select in lpl-helper.sh:
+# {device: (rom parent dir, path separator)}.
+LPL_PATH_STYLES = {
+    "vita":    ("ux0:/data/retroarch/roms", "/"),
+    "windows": (r"C:\RetroArch-Win64\roms", "\\"),
+    "android": ("/storage/emulated/0/RetroArch/roms", "/"),
+    "linux":   (os.path.expanduser("~") + "/RetroArch/roms", "/"),
+}
+
+# {RomName.lower(): title}, collected per platform and applied to
+# DAWN_JSON once at the end.
+_dawn_titles: Dict[str, str] = {}
+
+
+def rom_name_of(game_data: Dict[str, str]) -> str:
+    """Return the ROM filename a game record points at (its <path> basename)."""
+    return os.path.basename(game_data["path"])
+
+
+def write_gamelist_sink(
+    games: List[Dict[str, str]],
+    platform_lb: str,
+    platform_rp: str,
+    output_platform_dir: str,
+) -> None:
+    """ES / Batocera gamelist.xml inside the platform folder."""
+    write_gamelist_xml(games, os.path.join(output_platform_dir, "gamelist.xml"))
+
+
+def write_lpl_sink(
+    games: List[Dict[str, str]],
+    platform_lb: str,
+    platform_rp: str,
+    output_platform_dir: str,
+) -> None:
+    """
+    RetroArch <platform>.lpl in LPL_DIR.
+
+    Same entries lpl-helper.sh -g produces, including the ROM basename as
+    label (which RetroArch uses to find thumbnails), without walking the
+    ROM tree. LPL_TITLE_LABELS switches labels to game titles.
+    """
+    rom_parent_dir, sep = LPL_PATH_STYLES[LPL_PLATFORM]
+    lpl_dir = LPL_DIR or os.path.join(OUTPUT_DIR, "playlists")
+    os.makedirs(lpl_dir, exist_ok=True)
+    # CRCs recorded by copy_rom spare RetroArch from hashing on the device.
+    rom_index = load_rom_index(output_platform_dir)
+
+    def crc32_of(game_data: Dict[str, str]) -> str:
+        known = rom_index.get(rom_name_of(game_data))
+        return f"{known['crc32']}|crc" if known else "DETECT"
+
+    def label_of(game_data: Dict[str, str]) -> str:
+        if LPL_TITLE_LABELS:
+            return game_data["name"]
+        return os.path.splitext(rom_name_of(game_data))[0]
+
+    items = [
+        {
+            "path": f"{rom_parent_dir}{sep}{platform_rp}{sep}{rom_name_of(game_data)}",
+            "label": label_of(game_data),
+            "core_path": "DETECT",
+            "core_name": "DETECT",
+            "crc32": crc32_of(game_data),
+            "db_name": f"{platform_rp}.lpl",
+        }
+        for game_data in games
+    ]
+    items.sort(key=lambda item: item["label"].lower())
+
+    lpl_path = os.path.join(lpl_dir, f"{platform_rp}.lpl")
+    tmp_path = f"{lpl_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": "1.0", "items": items}, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, lpl_path)
+
+
+def collect_dawn_sink(
+    games: List[Dict[str, str]],
+    platform_lb: str,
+    platform_rp: str,
+    output_platform_dir: str,
+) -> None:
+    """Queue this platform's titles for write_dawn_json."""
+    for game_data in games:
+        _dawn_titles[rom_name_of(game_data).lower()] = game_data["name"]
+
+
+def write_dawn_json() -> None:
+    """
+    Patch every queued title into Dawn's Games.json (DAWN_JSON).
+
+    Same rules as dawn-gamelist-titlefix.py: Games.json is
+    {platform: {rom_name: {..., "Name", "RomName"}}}, RomName matches
+    case-insensitively, only "Name" is rewritten, and the file is saved
+    as compact single-line JSON. Games Dawn doesn't know about are left
+    for Dawn's own scanner to add.
+    """
+    if not _dawn_titles:
+        return
+    try:
+        with open(DAWN_JSON, "r", encoding="utf-8") as f:
+            games_data = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"  Error: Could not read Dawn JSON {DAWN_JSON}: {e}")
+        return
+
+    updated = 0
+    for platform_games in games_data.values():
+        if not isinstance(platform_games, dict):
+            continue
+        for game_info in platform_games.values():
+            if not isinstance(game_info, dict) or "RomName" not in game_info:
+                continue
+            title = _dawn_titles.get(str(game_info["RomName"]).lower())
+            if title is not None and game_info.get("Name") != title:
+                game_info["Name"] = title
+                updated += 1
+
+    if updated:
+        tmp_path = f"{DAWN_JSON}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(games_data, f, separators=(",", ":"))
+        os.replace(tmp_path, DAWN_JSON)
+    print(f"  Dawn: updated {updated} titles in {DAWN_JSON}")
+    _dawn_titles.clear()
+
+
+OUTPUT_SINKS = {
+    "gamelist": {"platform": write_gamelist_sink, "finish": None},
+    "lpl":      {"platform": write_lpl_sink,      "finish": None},
+    "dawn":     {"platform": collect_dawn_sink,   "finish": write_dawn_json},
+}
+
+
+def run_output_sinks(
+    games: List[Dict[str, str]],
+    platform_lb: str,
+    platform_rp: str,
+    output_platform_dir: str,
+    skip: Set[str] = frozenset(),
+) -> bool:
+    """Hand one platform's records to every sink in OUTPUTS. False if any failed."""
+    ok = True
+    for name in OUTPUTS:
+        if name in skip:
+            continue
+        try:
+            OUTPUT_SINKS[name]["platform"](games, platform_lb, platform_rp, output_platform_dir)
+        except Exception as e:
+            print(f"  Error writing {name} output: {e}")
+            ok = False
+    return ok
+
+
+def finish_output_sinks() -> None:
+    """Run the once-per-run hook of every sink in OUTPUTS."""
+    for name in OUTPUTS:
+        finish = OUTPUT_SINKS[name]["finish"]
+        if finish is None:
+            continue
+        try:
+            finish()
+        except Exception as e:
+            print(f"  Error finishing {name} output: {e}")
+
+
+# ============================================================================
+# REPORTING
+# ============================================================================
+
+REPORT_NAME = "export-report.json"
+
+
+class ExportReport:
+    """
+    What didn't go to plan on one platform, tallied by the worker threads.
+
+    Workers record events here instead of printing them, so a big first
+    export doesn't spend its time on tens of thousands of console writes.
+    The console gets a progress line at most every PROGRESS_INTERVAL
+    seconds and a short summary per platform; the full lists go into the
+    JSON report that write_export_report saves once at the end (or, in
+    watch mode, straight to the console after each refresh).
+    """
+
+    def __init__(self, platform_lb: str, platform_rp: str) -> None:
+        self.platform_lb = platform_lb
+        self.platform_rp = platform_rp
+        self.games = 0
+        self.missing: Dict[str, List[str]] = {}
+        self.failures: List[Dict[str, str]] = []
+        self.fallbacks: List[Dict[str, str]] = []
+        self.files_queued = 0
+        self.files_done = 0
+        self._lock = threading.Lock()
+        self._last_progress = 0.0
+        self._progress_shown = False
+
+    def add_missing(self, media_type: str, title: str) -> None:
+        with self._lock:
+            self.missing.setdefault(media_type, []).append(title)
+
+    def add_failure(self, stage: str, item: str, error: str) -> None:
+        with self._lock:
+            self.failures.append({"stage": stage, "item": item, "error": error})
+
+    def add_fallback(self, source: str, output: str, error: str) -> None:
+        with self._lock:
+            self.fallbacks.append({"source": source, "output": output, "error": error})
+
+    def file_queued(self) -> None:
+        with self._lock:
+            self.files_queued += 1
+
+    def file_done(self) -> None:
+        with self._lock:
+            self.files_done += 1
+            now = time.monotonic()
+            if now - self._last_progress < PROGRESS_INTERVAL:
+                return
+            self._last_progress = now
+            line = (f"  {self.files_done:,}/{self.files_queued:,} files written, "
+                    f"{len(self.failures):,} failures")
+            if sys.stdout.isatty():
+                print(f"\r{line}", end="", flush=True)
+                self._progress_shown = True
+            else:
+                print(line, flush=True)
+
+    def print_summary(self) -> None:
+        """Finish the progress line and print this platform's tallies."""
+        if self._progress_shown:
+            print()
+            self._progress_shown = False
+        if self.missing:
+            counts = ", ".join(f"{t} {len(v):,}" for t, v in sorted(self.missing.items()))
+            print(f"  Missing: {counts}")
+        if not (self.failures or self.fallbacks):
+            return
+        if not WATCH:
+            print(f"  Failures: {len(self.failures):,}, fallback copies: "
+                  f"{len(self.fallbacks):,} (details in {REPORT_PATH})")
+            return
+        # Watch mode never writes the report file, and a refresh only
+        # touches a handful of games, so list the details here.
+        for failure in self.failures:
+            print(f"  Failed ({failure['stage']}): {failure['item']}: "
+                  f"{failure['error'].strip().splitlines()[-1]}")
+        for fallback in self.fallbacks:
+            print(f"  Copied as-is: {fallback['source']} -> {fallback['output']} "
+                  f"({fallback['error']})")
+
+    def to_dict(self) -> Dict:
+        return {
+            "platform":  self.platform_lb,
+            "games":     self.games,
+            "files":     self.files_done,
+            "missing":   {t: sorted(v) for t, v in sorted(self.missing.items())},
+            "failures":  self.failures,
+            "fallbacks": self.fallbacks,
+        }
+
+
+def write_export_report(reports: List[ExportReport]) -> None:
+    """Save every platform's report to REPORT_PATH as one JSON document."""
+    document = {
+        "generated": datetime.now().isoformat(timespec="seconds"),
+        "totals": {
+            "games":     sum(r.games for r in reports),
+            "missing":   sum(len(v) for r in reports for v in r.missing.values()),
+            "failures":  sum(len(r.failures) for r in reports),
+            "fallbacks": sum(len(r.fallbacks) for r in reports),
+        },
+        "platforms": {r.platform_rp: r.to_dict() for r in reports},
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(REPORT_PATH)), exist_ok=True)
+    tmp_path = f"{REPORT_PATH}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, REPORT_PATH)
+
+
+# ============================================================================
+# SNAPSHOTS AND DELTA BUNDLES
+# ============================================================================
+#
+# A manifest lists every file under OUTPUT_DIR:
+#     {"id", "generated", "files": {relative path: {"size", "mtime", "sha1"}}}
+# "id" is derived from paths, sizes and hashes only, so a manifest hashed
+# from a device's copy has the same id as the one written at export time
+# whenever the contents agree. A delta bundle turns a baseline into the
+# current export:
+#     <DELTA_DIR>/files/...             new and changed files, same layout
+#     <DELTA_DIR>/deletions.txt         paths to remove, one per line
+#     <DELTA_DIR>/export-manifest.json  the device's manifest after applying
+#     <DELTA_DIR>/apply.sh              sh apply.sh <device export dir>
+
+MANIFEST_NAME = "export-manifest.json"
+DELTA_FILES_DIR = "files"
+DELTA_DELETIONS_NAME = "deletions.txt"
+
+APPLY_SCRIPT = r'''#!/bin/sh
+# Apply a launchbox-export.py delta bundle to a device's copy of the export:
+#     sh apply.sh <export dir on the device>
+# Set FORCE=1 to apply over a copy that isn't at this bundle's baseline.
+set -eu
+bundle=$(cd "$(dirname "$0")" && pwd)
+target=${1:?usage: sh apply.sh <export dir>}
+baseline="@BASELINE_ID@"
+
+if [ -f "$target/@MANIFEST@" ] && [ "${FORCE:-0}" != 1 ]; then
+    if ! grep -q "\"id\": \"$baseline\"" "$target/@MANIFEST@"; then
+        echo "$target is not at this bundle's baseline; set FORCE=1 to apply anyway" >&2
+        exit 1
+    fi
+fi
+
+while IFS= read -r path; do
+    if [ -n "$path" ]; then rm -f "$target/$path"; fi
+done < "$bundle/@DELETIONS@"
+
+if [ -d "$bundle/@FILES@" ]; then
+    cp -R "$bundle/@FILES@/." "$target/"
+fi
+cp "$bundle/@MANIFEST@" "$target/@MANIFEST@"
+echo "Applied @CHANGED@ new/changed files and @DELETED@ deletions to $target"
+'''
+
+
+def _sha1_file(path: str) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        while chunk := f.read(COPY_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def manifest_id(files: Dict[str, Dict]) -> str:
+    """Content id of a manifest: independent of mtimes and of where it was hashed."""
+    digest = hashlib.sha1()
+    for rel_path in sorted(files):
+        entry = files[rel_path]
+        digest.update(f"{rel_path}\t{entry['size']}\t{entry['sha1']}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def load_manifest(path: str) -> Dict:
+    """Read a manifest file. Raises OSError / ValueError if it isn't one."""
+    with open(path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("files"), dict):
+        raise ValueError(f"{path} is not an export manifest")
+    return manifest
+
+
+def scan_manifest(root: str, previous: Optional[Dict] = None,
+                  exclude: Set[str] = frozenset()) -> Dict:
+    """
+    Hash every file under root into a manifest.
+
+    Files whose size and mtime match their entry in `previous` keep that
+    entry's hash, so re-snapshotting an export only reads what it rewrote.
+    The manifest and export report themselves, top-level names starting
+    with "." or "_" (e.g. media-audit.py's _audit reports), temp files
+    and the absolute paths in `exclude` are left out.
+    """
+    known = (previous or {}).get("files", {})
+    files: Dict[str, Dict] = {}
+    to_hash: List[Tuple[str, str]] = []
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        if dirpath == root:
+            dirnames[:] = [d for d in dirnames if not d.startswith((".", "_"))]
+            filenames = [n for n in filenames
+                         if n not in (MANIFEST_NAME, REPORT_NAME)
+                         and not n.startswith((".", "_"))]
+        dirnames[:] = [d for d in dirnames
+                       if os.path.abspath(os.path.join(dirpath, d)) not in exclude]
+        for name in filenames:
+            full_path = os.path.join(dirpath, name)
+            if name.endswith((".tmp", ".part")) or os.path.abspath(full_path) in exclude:
+                continue
+            rel_path = os.path.relpath(full_path, root).replace(os.sep, "/")
+            st = os.stat(full_path)
+            entry = {"size": st.st_size, "mtime": st.st_mtime_ns}
+            old = known.get(rel_path)
+            if old and old.get("size") == entry["size"] and old.get("mtime") == entry["mtime"]:
+                entry["sha1"] = old["sha1"]
+            else:
+                to_hash.append((rel_path, full_path))
+            files[rel_path] = entry
+
+    if to_hash:
+        print(f"  Hashing {len(to_hash):,} files...")
+        with ThreadPoolExecutor(max_workers=max(1, WORKERS)) as executor:
+            hashes = executor.map(_sha1_file, (full for _, full in to_hash))
+            for (rel_path, _), sha1 in zip(to_hash, hashes):
+                files[rel_path]["sha1"] = sha1
+
+    return {
+        "id": manifest_id(files),
+        "generated": datetime.now().isoformat(timespec="seconds"),
+        "files": files,
+    }
+
+
+def write_manifest(manifest: Dict, path: str) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def load_baseline(path: str) -> Dict:
+    """
+    Baseline manifest from a manifest file or from a device's export copy.
+
+    A directory with its own export-manifest.json (i.e. a device that has
+    had bundles applied) is trusted as-is; otherwise the copy is hashed.
+    """
+    if not os.path.isdir(path):
+        return load_manifest(path)
+    own_manifest = os.path.join(path, MANIFEST_NAME)
+    if os.path.isfile(own_manifest):
+        return load_manifest(own_manifest)
+    print(f"\nHashing baseline copy {path}...")
+    return scan_manifest(path)
+
+
+def write_delta_bundle(baseline: Dict, current: Dict, delta_dir: str) -> Tuple[int, int, int]:
+    """
+    Write the bundle that updates a copy at `baseline` to `current`.
+
+    Returns (files_copied, bytes_copied, deletions).
+    """
+    old_files = baseline["files"]
+    new_files = current["files"]
+    changed = [
+        rel_path for rel_path, entry in sorted(new_files.items())
+        if rel_path not in old_files
+        or old_files[rel_path].get("sha1") != entry["sha1"]
+        or old_files[rel_path].get("size") != entry["size"]
+    ]
+    deletions = sorted(old_files.keys() - new_files.keys())
+
+    files_dir = os.path.join(delta_dir, DELTA_FILES_DIR)
+    if os.path.isdir(files_dir):
+        rmtree(files_dir)
+    os.makedirs(delta_dir, exist_ok=True)
+
+    bytes_copied = 0
+    for rel_path in changed:
+        dest_path = os.path.join(files_dir, *rel_path.split("/"))
+        os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+        copy2(os.path.join(OUTPUT_DIR, *rel_path.split("/")), dest_path)
+        bytes_copied += new_files[rel_path]["size"]
+
+    with open(os.path.join(delta_dir, DELTA_DELETIONS_NAME), "w",
+              encoding="utf-8", newline="\n") as f:
+        f.writelines(f"{rel_path}\n" for rel_path in deletions)
+    write_manifest(current, os.path.join(delta_dir, MANIFEST_NAME))
+
+    script = APPLY_SCRIPT
+    for placeholder, value in (
+        ("@BASELINE_ID@", baseline.get("id") or manifest_id(old_files)),
+        ("@MANIFEST@", MANIFEST_NAME),
+        ("@DELETIONS@", DELTA_DELETIONS_NAME),
+        ("@FILES@", DELTA_FILES_DIR),
+        ("@CHANGED@", str(len(changed))),
+        ("@DELETED@", str(len(deletions))),
+    ):
+        script = script.replace(placeholder, value)
+    script_path = os.path.join(delta_dir, "apply.sh")
+    with open(script_path, "w", encoding="utf-8", newline="\n") as f:
+        f.write(script)
+    os.chmod(script_path, 0o755)
+
+    return len(changed), bytes_copied, len(deletions)
+
+
+# ============================================================================
+# ADAPTIVE CONCURRENCY
+# ============================================================================
+
+class AdaptiveConcurrency:
+    """
+    Throughput-seeking cap on how many jobs run at once.
+
+    The pipeline's write stage keeps WORKERS threads, but each write must
+    acquire() a slot first. Every ADAPTIVE_WINDOW seconds the completed bytes (or
+    jobs, when nothing is written) per second are compared with the
+    previous window: the limit keeps moving one step in the same
+    direction while throughput improves by more than 5%, and turns
+    around when it drops or flattens. A plateau is treated like a drop
+    so slow targets (SD cards, NAS shares) drift down rather than up.
+    After three turnarounds the limit settles on the best level seen.
+    """
+
+    def __init__(self, max_workers: int, label: str = "") -> None:
+        self.max_workers = max(1, max_workers)
+        self.limit = min(2, self.max_workers)
+        self.settled = False
+        self._label = label
+        self._cond = threading.Condition()
+        self._active = 0
+        self._direction = 1
+        self._reversals = 0
+        self._last_rate: Optional[float] = None
+        self._rates: Dict[int, float] = {}
+        self._bytes_mode = False
+        self._reset_window()
+
+    def _reset_window(self) -> None:
+        self._window_start = time.monotonic()
+        self._window_bytes = 0
+        self._window_jobs = 0
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self._active >= self.limit:
+                self._cond.wait()
+            self._active += 1
+
+    def release(self, bytes_done: int) -> None:
+        with self._cond:
+            self._active -= 1
+            self._window_bytes += bytes_done
+            self._window_jobs += 1
+            if not self.settled:
+                self._maybe_adjust()
+            self._cond.notify_all()
+
+    def _maybe_adjust(self) -> None:
+        elapsed = time.monotonic() - self._window_start
+        # Need a full window and at least one completion per slot, or the
+        # measurement is dominated by whichever job happened to finish.
+        if elapsed < ADAPTIVE_WINDOW or self._window_jobs < self.limit:
+            return
+
+        self._bytes_mode = self._window_bytes > 0
+        rate = (self._window_bytes or self._window_jobs) / elapsed
+        self._rates[self.limit] = rate
+
+        if self._last_rate is not None and rate <= self._last_rate * 1.05:
+            self._direction = -self._direction
+            self._reversals += 1
+        self._last_rate = rate
+
+        if self._reversals >= 3:
+            self.limit = max(self._rates, key=self._rates.__getitem__)
+            self.settled = True
+            print(f"  Workers{self._label}: settled at {self.limit} of {self.max_workers}"
+                  f" ({self.describe_rate(self._rates[self.limit])})")
+            return
+
+        new_limit = self.limit + self._direction
+        if not 1 <= new_limit <= self.max_workers:
+            self._direction = -self._direction
+            new_limit = self.limit + self._direction
+        self.limit = max(1, min(self.max_workers, new_limit))
+        self._reset_window()
+
+    def describe_rate(self, rate: float) -> str:
+        if self._bytes_mode:
+            return f"{rate / 1_000_000:.1f} MB/s"
+        return f"{rate:.1f} jobs/s"
+
+
+# ============================================================================
+# MEDIA PIPELINE
+# ============================================================================
+
+class ByteBudgetQueue:
+    """
+    FIFO that blocks producers once the queued payload exceeds a budget.
+
+    An item bigger than the whole budget is still admitted when the queue
+    is empty, so one oversized file can't deadlock the pipeline.
+    """
+
+    def __init__(self, budget_bytes: int) -> None:
+        self._budget = budget_bytes
+        self._items: deque = deque()
+        self._bytes = 0
+        self._cond = threading.Condition()
+
+    def put(self, item: Optional[Dict], nbytes: int = 0) -> None:
+        with self._cond:
+            while self._items and self._bytes + nbytes > self._budget:
+                self._cond.wait()
+            self._items.append((item, nbytes))
+            self._bytes += nbytes
+            self._cond.notify_all()
+
+    def get(self) -> Optional[Dict]:
+        with self._cond:
+            while not self._items:
+                self._cond.wait()
+            item, nbytes = self._items.popleft()
+            self._bytes -= nbytes
+            self._cond.notify_all()
+            return item
+
+
+class DecodeBudget:
+    """
+    Admission control for image decodes, in estimated bytes of pixel data.
+
+    Each decode reserves what its header says it will need before any
+    pixels are read and waits while that would exceed the budget. The
+    oldest waiter holds its share in reserve, so a big image isn't starved
+    by a stream of small ones that keep fitting in around it; small images
+    still run alongside it whenever the remainder allows. An image bigger
+    than the whole budget waits for the others to finish and runs alone.
+    A budget of 0 disables the limit.
+    """
+
+    def __init__(self, budget_bytes: int) -> None:
+        self._budget = budget_bytes
+        self._used = 0
+        self._waiters: Dict[object, int] = {}
+        self._cond = threading.Condition()
+        self.waits = 0
+        self.peak = 0
+
+    def acquire(self, need: int) -> int:
+        """Block until `need` bytes fit; returns the amount to release()."""
+        if self._budget <= 0:
+            return 0
+        need = min(need, self._budget)
+        ticket = object()
+        with self._cond:
+            self._waiters[ticket] = need
+            if not self._admissible(ticket, need):
+                self.waits += 1
+                while not self._admissible(ticket, need):
+                    self._cond.wait()
+            del self._waiters[ticket]
+            self._used += need
+            self.peak = max(self.peak, self._used)
+            # The head of the line may have changed.
+            self._cond.notify_all()
+        return need
+
+    def release(self, reserved: int) -> None:
+        if not reserved:
+            return
+        with self._cond:
+            self._used -= reserved
+            self._cond.notify_all()
+
+    def _admissible(self, ticket: object, need: int) -> bool:
+        head = next(iter(self._waiters))
+        held_back = 0 if head is ticket else self._waiters[head]
+        return self._used + need + held_back <= self._budget
+
+
+_decode_budget = DecodeBudget(DECODE_BUDGET_MB * 1024 * 1024)
+
+
+def _pillow_pixel_bytes(mode: str) -> int:
+    """Bytes per pixel Pillow allocates for an image mode."""
+    if mode in ("1", "L", "P"):
+        return 1
+    if mode.startswith("I;16"):
+        return 2
+    # Every other mode, LA and PA included, is stored as 4 bytes per pixel.
+    return 4
+
+
+def estimate_decode_bytes(img, ext: str, media_type: str) -> int:
+    """
+    Peak pixel memory process_image will need, from an opened image's header.
+
+    The decoded source (only its current frame) plus whatever copy the
+    chosen path makes: a crop in the source mode for marquees, an RGB/RGBA
+    conversion (4 bytes per pixel) when converting to PNG, nothing when
+    the image is re-saved in its own format.
+    """
+    width, height = img.size
+    source_bytes = _pillow_pixel_bytes(img.mode)
+    if media_type == "marquee":
+        copy_bytes = source_bytes
+    elif CONVERT_TO_PNG and ext in [".jpg", ".jpeg", ".png"]:
+        copy_bytes = 4
+    else:
+        copy_bytes = 0
+    return width * height * (source_bytes + copy_bytes)
+
+
+class MediaPipeline:
+    """
+    Three-stage prefetch -> transform -> write pipeline for one platform.
+
+    Each stage has its own thread count, and bounded ByteBudgetQueues sit
+    between them: high-latency reads from a LaunchBox share overlap with
+    PIL encoding and with local writes, while backpressure keeps at most
+    ~2x PIPELINE_BUFFER_MB of file data queued. Files larger than a
+    quarter of the buffer (and ROMs) aren't prefetched; the write stage
+    streams them straight from the source instead. The write stage is
+    the one governed by AdaptiveConcurrency, with WORKERS as its ceiling.
+
+    Jobs are dicts built by save_media_file / process_game; call close()
+    to drain every stage before reading results.
+    """
+
+    def __init__(self, output_platform_dir: str, report: ExportReport) -> None:
+        budget = PIPELINE_BUFFER_MB * 1024 * 1024
+        self._report = report
+        self._stream_threshold = budget // 4
+        self._output_platform_dir = output_platform_dir
+        self._fetch_queue: "queue.Queue[Optional[Dict]]" = queue.Queue()
+        self._transform_queue = ByteBudgetQueue(budget)
+        self._write_queue = ByteBudgetQueue(budget)
+        self._limiter = (
+            AdaptiveConcurrency(WORKERS, f" ({os.path.basename(output_platform_dir)})")
+            if ADAPTIVE_WORKERS else None
+        )
+        self._stages = [
+            self._start(PREFETCH_WORKERS, self._fetch_queue.get, self._fetch),
+            self._start(TRANSFORM_WORKERS, self._transform_queue.get, self._transform),
+            self._start(WORKERS, self._write_queue.get, self._write),
+        ]
+
+    def _start(self, count: int, get, handle) -> List[threading.Thread]:
+        def loop() -> None:
+            while (job := get()) is not None:
+                try:
+                    handle(job)
+                except Exception:
+                    self._report.add_failure(handle.__name__.strip("_"), job["source"],
+                                             traceback.format_exc())
+
+        threads = [threading.Thread(target=loop, daemon=True) for _ in range(max(1, count))]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    def submit(self, job: Dict) -> None:
+        job["data"] = None
+        self._report.file_queued()
+        self._fetch_queue.put(job)
+
+    def close(self) -> None:
+        """Drain the stages in order and stop their threads."""
+        puts = [self._fetch_queue.put, self._transform_queue.put, self._write_queue.put]
+        for put, threads in zip(puts, self._stages):
+            for _ in threads:
+                put(None)
+            for thread in threads:
+                thread.join()
+
+    # -- stages --------------------------------------------------------------
+
+    def _fetch(self, job: Dict) -> None:
+        if job["kind"] != "rom" and os.path.getsize(job["source"]) <= self._stream_threshold:
+            with open(job["source"], "rb") as f:
+                job["data"] = f.read()
+        self._transform_queue.put(job, len(job["data"] or b""))
+
+    def _transform(self, job: Dict) -> None:
+        if job["kind"] == "image":
+            source = io.BytesIO(job["data"]) if job["data"] is not None else job["source"]
+            try:
+                job["data"] = process_image(source, job["ext"], job["media_type"])
+            except Exception as e:
+                # Pillow names its input in the message; for a prefetched
+                # source that is a BytesIO repr, so name the file instead.
+                message = str(e).replace(repr(source), repr(job["source"]))
+                self._report.add_fallback(job["source"], job["fallback"],
+                                          f"{type(e).__name__}: {message}")
+                job["filename"] = job["fallback"]
+                job["game_data"][job["xmltag"]] = (
+                    f"./{os.path.basename(job['output_dir'])}/{job['fallback']}"
+                )
+        self._write_queue.put(job, len(job["data"] or b""))
+
+    def _write(self, job: Dict) -> None:
+        if self._limiter is not None:
+            self._limiter.acquire()
+        written = 0
+        try:
+            if job["kind"] == "rom":
+                try:
+                    written = copy_rom(job["source"], self._output_platform_dir)
+                except Exception as e:
+                    self._report.add_failure("rom", job["source"], str(e))
+                return
+
+            os.makedirs(job["output_dir"], exist_ok=True)
+            output_path = os.path.join(job["output_dir"], job["filename"])
+            try:
+                if job["data"] is not None:
+                    with open(output_path, "wb") as f:
+                        f.write(job["data"])
+                    written = len(job["data"])
+                else:
+                    copy(job["source"], output_path)
+                    written = os.path.getsize(output_path)
+            except Exception as e:
+                self._report.add_failure("write", output_path, str(e))
+        finally:
+            job["data"] = None
+            self._report.file_done()
+            if self._limiter is not None:
+                self._limiter.release(written)
 
 
 # ============================================================================
@@ -364,23 +1560,27 @@ def write_gamelist_xml(games: List[Dict[str, str]], output_path: str) -> None:
 # ============================================================================
 
 def process_game(
-    game_elem: ET.Element,
+    record: GameRecord,
     output_platform_dir: str,
     media_index: List[Dict],
+    pipeline: Optional[MediaPipeline],
+    report: ExportReport,
 ) -> Tuple[Optional[Dict[str, str]], int]:
-    """Extract and export a single game. Returns (game_data, media_files_copied)."""
-    title_elem = game_elem.find("Title")
-    rom_path_elem = game_elem.find("ApplicationPath")
+    """
+    Extract a single game and queue its media (and ROM) on the pipeline.
 
-    if rom_path_elem is None or rom_path_elem.text is None:
-        return None, 0
-    if title_elem is None or not title_elem.text:
+    Returns (game_data, media_files_queued). game_data is complete once
+    pipeline.close() has returned. With a media_index from
+    build_output_media_index (METADATA_ONLY, and watch-mode startup) only
+    files already in the output are referenced and nothing is queued.
+    """
+    if record.rom_path is None or not record.title:
         return None, 0
 
-    game_title = title_elem.text
+    game_title = record.title
 
     try:
-        rom_path = rom_path_elem.text
+        rom_path = record.rom_path
         rom_name = os.path.basename(rom_path)
         rom_basename = os.path.splitext(rom_name)[0]
 
@@ -388,134 +1588,669 @@ def process_game(
             "path": f"./{rom_name}",
             "name": game_title,
         }
-        game_data.update(extract_game_metadata(game_elem))
+        game_data.update(extract_game_metadata(record))
 
         sanitized_title = sanitize_filename(game_title)
         media_count = 0
 
         for entry in media_index:
+            if "present" in entry:
+                present = entry["present"].get(rom_basename)
+                game_data[entry["xmltag"]] = f"./{entry['output']}/{present}" if present else ""
+                if present:
+                    media_count += 1
+                elif entry["output"] in ESSENTIAL_MEDIA_OUTPUTS:
+                    report.add_missing(entry["type"], game_title)
+                continue
+
             media_path = find_media_file(sanitized_title, entry["lookup"])
             if media_path:
                 output_dir = os.path.join(output_platform_dir, entry["output"])
-                rel_path = save_media_file(
-                    media_path, output_dir, rom_basename, entry["type"]
+                game_data[entry["xmltag"]] = save_media_file(
+                    media_path, output_dir, rom_basename, entry["type"],
+                    pipeline, game_data, entry["xmltag"],
                 )
-                game_data[entry["xmltag"]] = rel_path
                 media_count += 1
             else:
                 game_data[entry["xmltag"]] = ""
                 if entry["output"] in ESSENTIAL_MEDIA_OUTPUTS:
-                    print(f"  ERROR: No {entry['type']} found for: {game_title}")
+                    report.add_missing(entry["type"], game_title)
 
-        if COPY_ROMS and os.path.isfile(rom_path):
-            try:
-                copy(rom_path, output_platform_dir)
-            except Exception as e:
-                print(f"  Warning: Failed to copy ROM {rom_name}: {e}")
+        if COPY_ROMS and pipeline is not None and os.path.isfile(rom_path):
+            pipeline.submit({"kind": "rom", "source": rom_path})
 
         return game_data, media_count
 
-    except Exception as e:
-        print(f"  Error processing '{game_title}': {e}")
-        traceback.print_exc()
+    except Exception:
+        report.add_failure("process", game_title, traceback.format_exc())
         return None, 0
 
 
+def platform_xml_path(platform_lb: str) -> str:
+    """Return the LaunchBox platform XML path for a platform."""
+    return os.path.join(LB_DIR, "Data", "Platforms", f"{platform_lb}.xml")
+
+
+def media_source_dir(mapping: Dict, platform_lb: str) -> str:
+    """Return the LaunchBox source folder a MEDIA_MAPPINGS entry reads from."""
+    if mapping["subdir"].startswith(".."):
+        return os.path.join(
+            LB_DIR, mapping["subdir"].replace("..", "").strip("/\\"), platform_lb
+        )
+    return os.path.join(LB_DIR, "images", platform_lb, mapping["subdir"])
+
+
+def build_media_index(platform_lb: str, with_variants: bool = False) -> List[Dict]:
+    """
+    Index every MEDIA_MAPPINGS source folder for one platform.
+
+    Returned as a LOCAL list so the module-level MEDIA_MAPPINGS isn't
+    mutated or shared across platforms. with_variants also keeps every
+    file per lookup key ({key: sorted paths}), which watch mode needs to
+    update the lookup from changed paths alone.
+    """
+    return [
+        media_index_entry(mapping, platform_lb, with_variants)
+        for mapping in MEDIA_MAPPINGS
+    ]
+
+
+def media_index_entry(mapping: Dict, platform_lb: str, with_variants: bool) -> Dict:
+    """List one MEDIA_MAPPINGS source folder into a media_index entry."""
+    media_dir = media_source_dir(mapping, platform_lb)
+    media_files = list_media_files(media_dir)
+    entry = {
+        "type":   mapping["type"],
+        "xmltag": mapping["xmltag"],
+        "output": mapping["output"],
+        "dir":    media_dir,
+        "lookup": build_media_lookup(media_files),
+    }
+    if with_variants:
+        variants: Dict[str, List[str]] = {}
+        for filepath in sorted(media_files):
+            variants.setdefault(media_lookup_key(filepath), []).append(filepath)
+        entry["variants"] = variants
+    return entry
+
+
+def build_output_media_index(output_platform_dir: str) -> List[Dict]:
+    """
+    Index the media already in a platform's output, for METADATA_ONLY.
+
+    One scandir per output subfolder (covers/, marquees/, ...) yields
+    {rom_basename: filename}; LaunchBox's media folders aren't touched.
+    """
+    media_index: List[Dict] = []
+    for mapping in MEDIA_MAPPINGS:
+        present: Dict[str, str] = {}
+        try:
+            with os.scandir(os.path.join(output_platform_dir, mapping["output"])) as it:
+                for entry in sorted(it, key=lambda e: e.name):
+                    if entry.is_file():
+                        present.setdefault(os.path.splitext(entry.name)[0], entry.name)
+        except FileNotFoundError:
+            pass
+        media_index.append({
+            "type":    mapping["type"],
+            "xmltag":  mapping["xmltag"],
+            "output":  mapping["output"],
+            "present": present,
+        })
+    return media_index
+
+
+def export_games(
+    games: List[GameRecord],
+    output_platform_dir: str,
+    media_index: List[Dict],
+    report: ExportReport,
+    media_for: Optional[Callable[[GameRecord], List[Dict]]] = None,
+) -> Tuple[List[Dict[str, str]], int]:
+    """
+    Run process_game over `games` and push their files through a
+    MediaPipeline. `media_for`, if given, picks the media_index entries
+    to process per game (watch mode redoes only what changed).
+
+    Returns (game_data_list, media_files_copied). Resolving which files
+    a game needs is cheap and done here in order; all file I/O and PIL
+    work happens in the pipeline's stage threads.
+    """
+    games_found: List[Dict[str, str]] = []
+    media_total = 0
+    pipeline = None if METADATA_ONLY else MediaPipeline(output_platform_dir, report)
+
+    try:
+        for game in games:
+            game_data, media_count = process_game(
+                game, output_platform_dir,
+                media_for(game) if media_for else media_index, pipeline, report,
+            )
+            if game_data is not None:
+                games_found.append(game_data)
+                media_total += media_count
+    finally:
+        if pipeline is not None:
+            pipeline.close()
+
+    if COPY_ROMS and pipeline is not None:
+        try:
+            save_rom_index(output_platform_dir)
+        except OSError as e:
+            print(f"  Warning: Failed to write {ROM_INDEX_NAME}: {e}")
+
+    report.games += len(games_found)
+    return games_found, media_total
+
+
 def process_platform(
     platform_lb: str,
     platform_rp: str,
     cutoff_date: Optional[datetime],
-) -> Tuple[int, int, int]:
+    report: ExportReport,
+) -> Tuple[List[Dict[str, str]], int, int]:
     """
-    Process a single platform.
+    Process a single platform, tallying problems into report.
 
-    Returns (games_exported, media_copied, games_skipped_no_date).
+    Returns (exported game_data list, media_copied, games_skipped_no_date).
     """
     print(f"\nProcessing {platform_lb} → {platform_rp}")
 
-    lb_platform_xml = os.path.join(LB_DIR, "Data", "Platforms", f"{platform_lb}.xml")
+    lb_platform_xml = platform_xml_path(platform_lb)
     output_platform_dir = os.path.join(OUTPUT_DIR, platform_rp)
 
     if not os.path.isfile(lb_platform_xml):
         print(f"  Warning: Platform XML not found: {lb_platform_xml}")
-        return 0, 0, 0
+        return [], 0, 0
 
     os.makedirs(output_platform_dir, exist_ok=True)
 
     try:
-        xmltree = ET.parse(lb_platform_xml)
+        games_to_process, total_games, skipped_no_date = load_game_records(
+            lb_platform_xml, cutoff_date
+        )
     except ET.ParseError as e:
         print(f"  Error: Failed to parse XML: {e}")
-        return 0, 0, 0
+        return [], 0, 0
 
-    # Build per-platform media lookups as a LOCAL list so the module-level
-    # MEDIA_MAPPINGS isn't mutated or shared across platforms.
-    print("  Indexing media files...")
-    media_index: List[Dict] = []
-    for mapping in MEDIA_MAPPINGS:
-        if mapping["subdir"].startswith(".."):
-            media_dir = os.path.join(
-                LB_DIR, mapping["subdir"].replace("..", "").strip("/\\"), platform_lb
-            )
-        else:
-            media_dir = os.path.join(LB_DIR, "images", platform_lb, mapping["subdir"])
+    if METADATA_ONLY:
+        media_index = build_output_media_index(output_platform_dir)
+    else:
+        print("  Indexing media files...")
+        media_index = build_media_index(platform_lb)
 
-        media_files = list_media_files(media_dir)
-        media_index.append({
-            "type":   mapping["type"],
-            "xmltag": mapping["xmltag"],
-            "output": mapping["output"],
-            "lookup": build_media_lookup(media_files),
-        })
+    games_found, local_media_count = export_games(
+        games_to_process, output_platform_dir, media_index, report
+    )
+    report.print_summary()
 
-    # Filter games by date up front so the thread pool only sees eligible ones.
-    games_to_process: List[ET.Element] = []
-    skipped_no_date = 0
-    total_games = 0
+    if games_found and not run_output_sinks(
+        games_found, platform_lb, platform_rp, output_platform_dir
+    ):
+        return [], 0, skipped_no_date
 
-    for game in xmltree.getroot().iter("Game"):
-        total_games += 1
-        if cutoff_date is not None:
-            is_recent, has_date = is_game_recent(game, cutoff_date)
-            if not has_date:
-                skipped_no_date += 1
+    if RECENTS_ONLY:
+        print(f"  Exported {len(games_found)} recent games out of {total_games} total")
+        if skipped_no_date:
+            print(f"  Skipped {skipped_no_date} games with missing/unparseable DateAdded")
+    else:
+        print(f"  Exported {len(games_found)} games")
+
+    return games_found, local_media_count, skipped_no_date
+
+
+# ============================================================================
+# WATCH MODE
+# ============================================================================
+
+# inotify(7) event bits used by InotifyWatcher.
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM  = 0x00000040
+IN_MOVED_TO    = 0x00000080
+IN_CREATE      = 0x00000100
+IN_DELETE      = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF   = 0x00000800
+IN_Q_OVERFLOW  = 0x00004000
+IN_IGNORED     = 0x00008000
+IN_ISDIR       = 0x40000000
+
+INOTIFY_MASK = (IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE
+                | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+INOTIFY_EVENT = struct.Struct("iIII")
+
+
+def _is_within(path: str, root: str) -> bool:
+    """True if path is root itself or somewhere beneath it."""
+    return path == root or path.startswith(root.rstrip(os.sep) + os.sep)
+
+
+class InotifyWatcher:
+    """
+    Recursive directory watcher on Linux inotify, via ctypes (no extra deps).
+
+    Roots that don't exist yet are anchored on their nearest existing
+    ancestor and picked up once created. Raises OSError if inotify is
+    unavailable so the caller can fall back to PollingWatcher.
+    """
+
+    def __init__(self, roots: List[str]) -> None:
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._roots = [os.path.abspath(r) for r in roots]
+        self._wds: Dict[int, str] = {}
+        self._watched_roots: Set[str] = set()
+        self._ensure_roots()
+
+    def _add_watch(self, path: str) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), INOTIFY_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err == errno.ENOSPC:
+                raise OSError(err, "inotify watch limit reached "
+                                   "(raise fs.inotify.max_user_watches)")
+            return  # vanished between listing and watching
+        self._wds[wd] = path
+
+    def _add_tree(self, top: str) -> List[str]:
+        """Watch top and every directory beneath it; return files found."""
+        files: List[str] = []
+        for root, _, filenames in os.walk(top):
+            self._add_watch(root)
+            files.extend(os.path.join(root, fn) for fn in filenames)
+        return files
+
+    def _ensure_roots(self) -> None:
+        for root in self._roots:
+            if root in self._watched_roots:
                 continue
-            if not is_recent:
+            if os.path.isdir(root):
+                self._add_tree(root)
+                self._watched_roots.add(root)
                 continue
-        games_to_process.append(game)
+            anchor = os.path.dirname(root)
+            while anchor and not os.path.isdir(anchor) and anchor != os.path.dirname(anchor):
+                anchor = os.path.dirname(anchor)
+            if os.path.isdir(anchor):
+                self._add_watch(anchor)
+
+    def _read_events(self) -> Tuple[Set[str], bool]:
+        changed: Set[str] = set()
+        overflow = False
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return changed, overflow
+
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = INOTIFY_EVENT.unpack_from(data, offset)
+                offset += INOTIFY_EVENT.size
+                name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+                offset += length
+
+                if mask & IN_Q_OVERFLOW:
+                    overflow = True
+                    continue
+                base = self._wds.get(wd)
+                if base is None:
+                    continue
+                if mask & IN_IGNORED:
+                    del self._wds[wd]
+                    if base in self._watched_roots:
+                        self._watched_roots.discard(base)
+                        self._ensure_roots()
+                    continue
+
+                path = os.path.join(base, name) if name else base
+                changed.add(path)
+                if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                    if any(_is_within(path, root) for root in self._roots):
+                        # Files can land before the watch exists; report them too.
+                        changed.update(self._add_tree(path))
+                    else:
+                        self._ensure_roots()
+
+    def wait_for_changes(self) -> Optional[Set[str]]:
+        """
+        Block until something changes, then debounce.
+
+        Keeps collecting until WATCH_DEBOUNCE seconds pass without a new
+        event (capped at 10x that so a constant trickle still flushes).
+        Returns the changed paths, or None if the kernel queue overflowed
+        and the caller should rescan everything.
+        """
+        select.select([self._fd], [], [])
+        changed: Set[str] = set()
+        overflow = False
+        deadline = time.monotonic() + WATCH_DEBOUNCE * 10
+        while True:
+            batch, lost = self._read_events()
+            changed |= batch
+            overflow |= lost
+            remaining = min(WATCH_DEBOUNCE, deadline - time.monotonic())
+            if remaining <= 0 or not select.select([self._fd], [], [], remaining)[0]:
+                return None if overflow else changed
+
+
+class PollingWatcher:
+    """
+    Portable fallback: re-stat the watched trees every WATCH_POLL_INTERVAL.
 
-    # Process in parallel. I/O-bound work (disk copies, PIL conversions
-    # that release the GIL) benefits from threads.
-    games_found: List[Dict[str, str]] = []
-    local_media_count = 0
+    Used on Windows and on network mounts, where inotify never fires.
+    """
 
-    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
-        futures = [
-            executor.submit(process_game, game, output_platform_dir, media_index)
-            for game in games_to_process
-        ]
-        for future in as_completed(futures):
-            game_data, media_count = future.result()
+    def __init__(self, roots: List[str]) -> None:
+        self._roots = [os.path.abspath(r) for r in roots]
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[str, Tuple[float, int]]:
+        snapshot: Dict[str, Tuple[float, int]] = {}
+        stack = [r for r in self._roots if os.path.isdir(r)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            st = entry.stat()
+                            snapshot[entry.path] = (st.st_mtime, st.st_size)
+            except OSError:
+                continue
+        return snapshot
+
+    def wait_for_changes(self) -> Optional[Set[str]]:
+        """Poll until something changes, then until a poll comes back quiet."""
+        changed: Set[str] = set()
+        while True:
+            time.sleep(WATCH_DEBOUNCE if changed else WATCH_POLL_INTERVAL)
+            snapshot = self._scan()
+            diff = {
+                path for path in snapshot.keys() | self._snapshot.keys()
+                if snapshot.get(path) != self._snapshot.get(path)
+            }
+            self._snapshot = snapshot
+            if diff:
+                changed |= diff
+            elif changed:
+                return changed
+
+
+def game_key(record: GameRecord) -> str:
+    """Return the gamelist.xml <path> a decoded game exports to."""
+    return f"./{os.path.basename(record.rom_path)}"
+
+
+def load_platform_games(
+    platform_lb: str,
+) -> Optional[Dict[str, Tuple[Tuple[Optional[str], ...], GameRecord]]]:
+    """
+    Decode a platform XML into {game_key: (fingerprint, GameRecord)}.
+
+    Any edit in LaunchBox to a field the exporter uses changes the
+    fingerprint. Returns None if the XML is missing or mid-write.
+    """
+    try:
+        records, _, _ = load_game_records(platform_xml_path(platform_lb))
+    except (OSError, ET.ParseError) as e:
+        print(f"  Warning: Could not read {platform_lb} XML: {e}")
+        return None
+    return {game_key(record): (record.fingerprint(), record) for record in records}
+
+
+def seed_platform_records(
+    platform_lb: str,
+    platform_rp: str,
+    output_dir: str,
+    games: Dict[str, Tuple[Tuple[Optional[str], ...], GameRecord]],
+) -> Dict[str, Dict[str, str]]:
+    """
+    The exported records the watcher patches and re-runs the sinks from.
+
+    Read from gamelist.xml when that is an output (keeping fields added by
+    frontends); otherwise rebuilt from the media already in the output
+    folders, as --metadata-only does. A platform with neither gets a full
+    export first.
+    """
+    gamelist_path = os.path.join(output_dir, "gamelist.xml")
+    if "gamelist" in OUTPUTS:
+        if os.path.isfile(gamelist_path):
+            try:
+                return {g.get("path", ""): g for g in read_gamelist_xml(gamelist_path)}
+            except (OSError, ET.ParseError) as e:
+                print(f"  Warning: Could not read {gamelist_path}: {e}")
+    elif os.path.isdir(output_dir):
+        report = ExportReport(platform_lb, platform_rp)
+        output_index = build_output_media_index(output_dir)
+        records: Dict[str, Dict[str, str]] = {}
+        for _, record in games.values():
+            game_data, _ = process_game(record, output_dir, output_index, None, report)
             if game_data is not None:
-                games_found.append(game_data)
-                local_media_count += media_count
+                records[game_data["path"]] = game_data
+        return records
 
-    if games_found:
-        xml_path = os.path.join(output_platform_dir, "gamelist.xml")
-        try:
-            write_gamelist_xml(games_found, xml_path)
-        except Exception as e:
-            print(f"  Error writing gamelist.xml: {e}")
-            return 0, 0, skipped_no_date
+    games_found, _, _ = process_platform(platform_lb, platform_rp, None,
+                                         ExportReport(platform_lb, platform_rp))
+    return {g["path"]: g for g in games_found}
 
-    if RECENTS_ONLY:
-        print(f"  Exported {len(games_found)} recent games out of {total_games} total")
-        if skipped_no_date:
-            print(f"  Skipped {skipped_no_date} games with missing/unparseable DateAdded")
+
+def update_media_entry(entry: Dict, paths: Set[str]) -> Set[str]:
+    """
+    Apply changed source paths (absolute) to a watch-mode media index entry.
+
+    Only the changed files and any directory created under the folder are
+    looked at; the folder itself isn't re-listed. Returns the lookup keys
+    touched. Files overwritten in place keep their lookup entry but are
+    still returned, so their games get re-processed.
+    """
+    media_dir = os.path.abspath(entry["dir"])
+    variants = entry["variants"]
+    lookup = entry["lookup"]
+    touched: Set[str] = set()
+
+    for path in paths:
+        # Stored paths are as list_media_files returned them, under entry["dir"].
+        local_path = os.path.normpath(
+            os.path.join(entry["dir"], os.path.relpath(path, media_dir)))
+        if os.path.isdir(local_path):
+            added = list_media_files(local_path)
+            gone: List[str] = []
+        else:
+            added = [local_path] if os.path.isfile(local_path) else []
+            # A deleted or moved-away directory takes every file beneath it.
+            gone = [p for files in variants.values() for p in files
+                    if p == local_path or _is_within(p, local_path)]
+
+        for filepath in gone + added:
+            key = media_lookup_key(filepath)
+            files = variants.setdefault(key, [])
+            if filepath in files:
+                files.remove(filepath)
+            if filepath in added:
+                bisect.insort(files, filepath)
+            if files:
+                lookup[key] = files[0]
+            else:
+                del variants[key]
+                lookup.pop(key, None)
+            touched.add(key)
+    return touched
+
+
+def refresh_platform(
+    state: Dict,
+    xml_changed: bool,
+    media_changes: Dict[int, Set[str]],
+) -> None:
+    """
+    Re-export only what changed on one platform and update its outputs.
+
+    `media_changes` maps a media_index position to the changed source
+    paths under it, which update_media_entry applies to that folder's
+    lookup; an empty set (lost events) re-lists the folder instead.
+    Games whose media key moved get just that media type re-processed.
+    Games whose XML fingerprint changed get their metadata rebuilt and
+    keep their exported media fields, unless they are new or retitled
+    (media is looked up by title), in which case all media is redone.
+    """
+    platform_lb = state["platform_lb"]
+    games = state["games"]
+    records = state["records"]
+    media_index = state["media_index"]
+    dirty: Set[str] = set()
+    full: Set[str] = set()
+    removed: Set[str] = set()
+
+    if xml_changed:
+        new_games = load_platform_games(platform_lb)
+        if new_games is not None:
+            removed = games.keys() - new_games.keys()
+            for key, (fingerprint, record) in new_games.items():
+                if (key not in games or key not in records
+                        or games[key][1].title != record.title):
+                    full.add(key)
+                elif games[key][0] != fingerprint:
+                    dirty.add(key)
+            games = state["games"] = new_games
+
+    affected_media_keys: Dict[int, Set[str]] = {}
+    for idx, paths in media_changes.items():
+        entry = media_index[idx]
+        if paths:
+            affected_media_keys[idx] = update_media_entry(entry, paths)
+            continue
+        old_lookup = entry["lookup"]
+        entry.update(media_index_entry(MEDIA_MAPPINGS[idx], platform_lb, True))
+        affected_media_keys[idx] = {
+            key for key in old_lookup.keys() | entry["lookup"].keys()
+            if old_lookup.get(key) != entry["lookup"].get(key)
+        }
+
+    def media_for(record: GameRecord) -> List[Dict]:
+        """The media_index entries to push through the pipeline for a game."""
+        if game_key(record) in full:
+            return media_index
+        title_key = sanitize_filename(record.title).lower()
+        return [entry for idx, entry in enumerate(media_index)
+                if title_key in affected_media_keys.get(idx, ())]
+
+    if any(affected_media_keys.values()):
+        dirty.update(key for key, (_, record) in games.items() if media_for(record))
+    dirty |= full
+
+    if not dirty and not removed:
+        return
+
+    report = ExportReport(platform_lb, state["platform_rp"])
+    games_found, media_count = export_games(
+        [games[key][1] for key in sorted(dirty)],
+        state["output_dir"],
+        media_index,
+        report,
+        media_for,
+    )
+    report.print_summary()
+
+    # Media fields that weren't re-processed keep their exported values.
+    media_tags = [entry["xmltag"] for entry in media_index]
+    updated: Dict[str, Dict[str, str]] = {}
+    for game_data in games_found:
+        previous = records.get(game_data["path"], {})
+        merged = {k: v for k, v in game_data.items() if k not in media_tags}
+        for tag in media_tags:
+            merged[tag] = game_data[tag] if tag in game_data else previous.get(tag, "")
+        updated[game_data["path"]] = merged
+
+    skip: Set[str] = set()
+    if "gamelist" in OUTPUTS:
+        # Patched in place so fields added by frontends survive.
+        xml_path = os.path.join(state["output_dir"], "gamelist.xml")
+        try:
+            patched = patch_gamelist_xml(xml_path, updated, removed)
+        except (OSError, ET.ParseError) as e:
+            print(f"  Error patching {xml_path}: {e}")
+            return
+        records = state["records"] = {g.get("path", ""): g for g in patched}
+        skip.add("gamelist")
     else:
-        print(f"  Exported {len(games_found)} games")
+        for path in removed:
+            records.pop(path, None)
+        records.update(updated)
+
+    # Every other sink re-serialises the whole platform from the records.
+    run_output_sinks(list(records.values()), platform_lb, state["platform_rp"],
+                     state["output_dir"], skip=skip)
+    finish_output_sinks()
+
+    stamp = datetime.now().strftime("%H:%M:%S")
+    print(f"[{stamp}] {platform_lb}: {len(games_found)} updated "
+          f"({media_count} media), {len(removed)} removed")
 
-    return len(games_found), local_media_count, skipped_no_date
+
+def watch_platforms() -> None:
+    """
+    Watch LaunchBox for changes and patch the export as they happen.
+
+    Assumes OUTPUT_DIR is already current (run a normal export first);
+    platforms that were never exported get a full export on startup (see
+    seed_platform_records). RECENTS_ONLY is ignored: every edited game
+    is re-exported.
+    """
+    states: Dict[str, Dict] = {}
+    roots: List[str] = [os.path.join(LB_DIR, "Data", "Platforms")]
+
+    for platform_lb, platform_rp in PLATFORMS.items():
+        output_dir = os.path.join(OUTPUT_DIR, platform_rp)
+        games = load_platform_games(platform_lb) or {}
+        records = seed_platform_records(platform_lb, platform_rp, output_dir, games)
+
+        print(f"  Priming watch state for {platform_lb}...")
+        states[platform_lb] = {
+            "platform_lb": platform_lb,
+            "platform_rp": platform_rp,
+            "output_dir":  output_dir,
+            "xml_path":    os.path.abspath(platform_xml_path(platform_lb)),
+            "games":       games,
+            "records":     records,
+            "media_index": build_media_index(platform_lb, with_variants=True),
+        }
+        roots.extend(entry["dir"] for entry in states[platform_lb]["media_index"])
+
+    try:
+        watcher = InotifyWatcher(roots)
+        print(f"\nWatching {len(roots)} folders with inotify (Ctrl+C to stop)")
+    except OSError as e:
+        watcher = PollingWatcher(roots)
+        print(f"\ninotify unavailable ({e}); polling every {WATCH_POLL_INTERVAL}s "
+              f"(Ctrl+C to stop)")
+
+    while True:
+        changed = watcher.wait_for_changes()
+
+        for state in states.values():
+            if changed is None:
+                # Lost events: diff everything against the previous state.
+                refresh_platform(state, True, {
+                    idx: set() for idx in range(len(state["media_index"]))
+                })
+                continue
+
+            xml_changed = state["xml_path"] in changed
+            media_changes: Dict[int, Set[str]] = {}
+            for idx, entry in enumerate(state["media_index"]):
+                media_dir = os.path.abspath(entry["dir"])
+                paths = {p for p in changed if _is_within(p, media_dir)}
+                if paths:
+                    media_changes[idx] = paths
+            if xml_changed or media_changes:
+                refresh_platform(state, xml_changed, media_changes)
 
 
 # ============================================================================
@@ -532,8 +2267,16 @@ def parse_args() -> argparse.Namespace:
                         help="Destination directory (default: %(default)s)")
     parser.add_argument("--copy-roms", action=argparse.BooleanOptionalAction,
                         default=COPY_ROMS, help="Also copy ROM files (default: %(default)s)")
+    parser.add_argument("--verify-roms", action=argparse.BooleanOptionalAction,
+                        default=VERIFY_ROMS,
+                        help="Re-read copied ROMs to check CRC32 and SHA1; doubles "
+                             "ROM copy I/O (default: %(default)s)")
     parser.add_argument("--copy-media", action=argparse.BooleanOptionalAction,
                         default=COPY_MEDIA, help="Copy media files (default: %(default)s)")
+    parser.add_argument("--metadata-only", action=argparse.BooleanOptionalAction,
+                        default=METADATA_ONLY,
+                        help="Only rewrite gamelist metadata, referencing media already "
+                             "in the output (default: %(default)s)")
     parser.add_argument("--convert-to-png", action=argparse.BooleanOptionalAction,
                         default=CONVERT_TO_PNG,
                         help="Convert JPG images to PNG (default: %(default)s)")
@@ -543,28 +2286,140 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--recent-days", type=int, default=RECENT_DAYS,
                         help="Days threshold for --recents-only (default: %(default)s)")
     parser.add_argument("--workers", type=int, default=WORKERS,
-                        help="Thread-pool size for media copying (default: %(default)s)")
-    return parser.parse_args()
+                        help="Output-writer threads; the upper limit "
+                             "with --adaptive-workers (default: %(default)s)")
+    parser.add_argument("--adaptive-workers", action=argparse.BooleanOptionalAction,
+                        default=ADAPTIVE_WORKERS,
+                        help="Tune active workers to measured throughput (default: %(default)s)")
+    parser.add_argument("--adaptive-window", type=float, default=ADAPTIVE_WINDOW,
+                        help="Seconds per throughput measurement (default: %(default)s)")
+    parser.add_argument("--prefetch-workers", type=int, default=PREFETCH_WORKERS,
+                        help="Concurrent source reads (default: %(default)s)")
+    parser.add_argument("--transform-workers", type=int, default=TRANSFORM_WORKERS,
+                        help="Concurrent image encodes (default: %(default)s)")
+    parser.add_argument("--pipeline-buffer-mb", type=int, default=PIPELINE_BUFFER_MB,
+                        help="File data buffered between each pipeline stage, "
+                             "in MB (default: %(default)s)")
+    parser.add_argument("--decode-budget-mb", type=int, default=DECODE_BUDGET_MB,
+                        help="Pixel memory shared by concurrent image decodes, "
+                             "in MB; 0 = unlimited (default: %(default)s)")
+    parser.add_argument("--outputs", type=lambda s: s.split(","), default=",".join(OUTPUTS),
+                        help="Comma-separated outputs to write from one pass: "
+                             f"{','.join(OUTPUT_SINKS)} (default: %(default)s)")
+    parser.add_argument("--lpl-platform", choices=sorted(LPL_PATH_STYLES),
+                        default=LPL_PLATFORM,
+                        help="ROM path style inside .lpl playlists (default: %(default)s)")
+    parser.add_argument("--lpl-dir", default=LPL_DIR,
+                        help="Directory for .lpl playlists (default: <output-dir>/playlists)")
+    parser.add_argument("--lpl-title-labels", action=argparse.BooleanOptionalAction,
+                        default=LPL_TITLE_LABELS,
+                        help="Label .lpl entries by game title instead of ROM basename; "
+                             "thumbnails must then be named by title (default: %(default)s)")
+    parser.add_argument("--dawn-json", default=DAWN_JSON,
+                        help="Dawn Games.json to patch with exported titles")
+    parser.add_argument("--watch", action=argparse.BooleanOptionalAction,
+                        default=WATCH,
+                        help="Keep running and re-export games as LaunchBox changes")
+    parser.add_argument("--watch-debounce", type=float, default=WATCH_DEBOUNCE,
+                        help="Seconds of quiet before a burst of changes is "
+                             "processed (default: %(default)s)")
+    parser.add_argument("--watch-poll-interval", type=float, default=WATCH_POLL_INTERVAL,
+                        help="Polling interval when inotify is unavailable "
+                             "(default: %(default)s)")
+    parser.add_argument("--report", dest="report_path", default=REPORT_PATH,
+                        help="JSON report of missing media and failures "
+                             "(default: <output-dir>/export-report.json)")
+    parser.add_argument("--progress-interval", type=float, default=PROGRESS_INTERVAL,
+                        help="Seconds between progress lines (default: %(default)s)")
+    parser.add_argument("--snapshot", action=argparse.BooleanOptionalAction,
+                        default=SNAPSHOT,
+                        help="Write <output-dir>/export-manifest.json with file sizes "
+                             "and hashes (default: %(default)s)")
+    parser.add_argument("--baseline", default=BASELINE,
+                        help="Manifest file or device export copy to build the delta from "
+                             "(default: the previous <output-dir>/export-manifest.json)")
+    parser.add_argument("--delta-dir", default=DELTA_DIR,
+                        help="Write a delta bundle of new/changed files, deletions "
+                             "and apply.sh here")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.outputs if name not in OUTPUT_SINKS]
+    if unknown:
+        parser.error(f"unknown --outputs: {', '.join(unknown)}")
+    if args.metadata_only and args.watch:
+        parser.error("--metadata-only can't be combined with --watch")
+    if args.watch and (args.snapshot or args.delta_dir):
+        parser.error("--snapshot/--delta-dir can't be combined with --watch")
+    if args.baseline and not args.delta_dir:
+        parser.error("--baseline requires --delta-dir")
+    if "dawn" in args.outputs and not args.dawn_json:
+        parser.error("--outputs dawn requires --dawn-json")
+    return args
 
 
 def main() -> None:
     global LB_DIR, OUTPUT_DIR, COPY_ROMS, COPY_MEDIA, CONVERT_TO_PNG
-    global RECENTS_ONLY, RECENT_DAYS, WORKERS
+    global RECENTS_ONLY, RECENT_DAYS, WORKERS, ADAPTIVE_WORKERS, ADAPTIVE_WINDOW
+    global PREFETCH_WORKERS, TRANSFORM_WORKERS, PIPELINE_BUFFER_MB
+    global DECODE_BUDGET_MB, _decode_budget
+    global VERIFY_ROMS, METADATA_ONLY
+    global OUTPUTS, LPL_PLATFORM, LPL_DIR, LPL_TITLE_LABELS, DAWN_JSON
+    global WATCH, WATCH_DEBOUNCE, WATCH_POLL_INTERVAL
+    global REPORT_PATH, PROGRESS_INTERVAL, SNAPSHOT, BASELINE, DELTA_DIR
 
     args = parse_args()
     LB_DIR         = args.lb_dir
     OUTPUT_DIR     = args.output_dir
     COPY_ROMS      = args.copy_roms
+    VERIFY_ROMS    = args.verify_roms
     COPY_MEDIA     = args.copy_media
+    METADATA_ONLY  = args.metadata_only
     CONVERT_TO_PNG = args.convert_to_png
     RECENTS_ONLY   = args.recents_only
     RECENT_DAYS    = args.recent_days
     WORKERS        = args.workers
+    ADAPTIVE_WORKERS = args.adaptive_workers
+    ADAPTIVE_WINDOW  = args.adaptive_window
+    PREFETCH_WORKERS   = args.prefetch_workers
+    TRANSFORM_WORKERS  = args.transform_workers
+    PIPELINE_BUFFER_MB = args.pipeline_buffer_mb
+    DECODE_BUDGET_MB   = args.decode_budget_mb
+    _decode_budget     = DecodeBudget(DECODE_BUDGET_MB * 1024 * 1024)
+    OUTPUTS        = args.outputs
+    LPL_PLATFORM   = args.lpl_platform
+    LPL_DIR        = args.lpl_dir
+    LPL_TITLE_LABELS = args.lpl_title_labels
+    DAWN_JSON      = args.dawn_json
+    WATCH          = args.watch
+    WATCH_DEBOUNCE = args.watch_debounce
+    WATCH_POLL_INTERVAL = args.watch_poll_interval
+    REPORT_PATH    = args.report_path or os.path.join(OUTPUT_DIR, REPORT_NAME)
+    PROGRESS_INTERVAL = args.progress_interval
+    DELTA_DIR      = args.delta_dir
+    SNAPSHOT       = args.snapshot or bool(DELTA_DIR)
+    BASELINE       = args.baseline or (
+        os.path.join(OUTPUT_DIR, MANIFEST_NAME) if DELTA_DIR else "")
 
     print("=" * 70)
     print("LaunchBox to Batocera Export")
     print("=" * 70)
 
+    if WATCH:
+        try:
+            watch_platforms()
+        except KeyboardInterrupt:
+            print("\nStopped watching.")
+        return
+
+    # Read the baseline before the export rewrites the files it may describe.
+    baseline: Optional[Dict] = None
+    if DELTA_DIR:
+        try:
+            baseline = load_baseline(BASELINE)
+        except (OSError, ValueError) as e:
+            sys.exit(f"Error: Could not read baseline {BASELINE}: {e} "
+                     "(run once with --snapshot, or pass --baseline)")
+
     cutoff_date: Optional[datetime] = None
     if RECENTS_ONLY:
         cutoff_date = datetime.now() - timedelta(days=RECENT_DAYS)
@@ -574,17 +2429,40 @@ def main() -> None:
     total_media = 0
     total_skipped_no_date = 0
     total_platforms = 0
+    reports: List[ExportReport] = []
 
     for platform_lb, platform_rp in PLATFORMS.items():
-        games_count, media_count, skipped_no_date = process_platform(
-            platform_lb, platform_rp, cutoff_date
+        report = ExportReport(platform_lb, platform_rp)
+        reports.append(report)
+        games_found, media_count, skipped_no_date = process_platform(
+            platform_lb, platform_rp, cutoff_date, report
         )
+        games_count = len(games_found)
         total_skipped_no_date += skipped_no_date
         if games_count > 0:
             total_games += games_count
             total_media += media_count
             total_platforms += 1
 
+    finish_output_sinks()
+    write_export_report(reports)
+
+    delta_summary = ""
+    if SNAPSHOT:
+        print("\nSnapshotting export...")
+        manifest_path = os.path.join(OUTPUT_DIR, MANIFEST_NAME)
+        try:
+            previous = load_manifest(manifest_path)
+        except (OSError, ValueError):
+            previous = None
+        exclude = {os.path.abspath(p) for p in (REPORT_PATH, DELTA_DIR) if p}
+        manifest = scan_manifest(OUTPUT_DIR, previous, exclude)
+        write_manifest(manifest, manifest_path)
+        if baseline is not None:
+            changed, changed_bytes, deleted = write_delta_bundle(baseline, manifest, DELTA_DIR)
+            delta_summary = (f"{changed:,} files ({changed_bytes / 1024 / 1024:,.1f} MB), "
+                             f"{deleted:,} deletions → {DELTA_DIR}")
+
     print("\n" + "=" * 70)
     print("Export Complete!")
     print(f"  Platforms:   {total_platforms}")
@@ -592,6 +2470,16 @@ def main() -> None:
     print(f"  Media files: {total_media:,}")
     if RECENTS_ONLY and total_skipped_no_date:
         print(f"  Skipped (no DateAdded): {total_skipped_no_date:,}")
+    total_missing = sum(len(v) for r in reports for v in r.missing.values())
+    total_failures = sum(len(r.failures) for r in reports)
+    if total_missing or total_failures:
+        print(f"  Missing media: {total_missing:,}, failures: {total_failures:,}")
+    print(f"  Report:      {REPORT_PATH}")
+    if _decode_budget.waits:
+        print(f"  Decode waits: {_decode_budget.waits:,} "
+              f"(peak {_decode_budget.peak / 1024 / 1024:,.0f} MB of {DECODE_BUDGET_MB:,} MB)")
+    if delta_summary:
+        print(f"  Delta:       {delta_summary}")
     print("=" * 70)
 
 
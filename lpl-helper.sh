@@ -9,6 +9,10 @@
 #       RetroArch to resolve at scan/launch. No hashing or DB lookup
 #       is performed here, so subdirectory names must match RetroArch's
 #       expected system names for DETECT to match a core.
+#       When exporting from LaunchBox, `launchbox-export.py --outputs
+#       gamelist,lpl --lpl-platform <device>` writes the same playlists
+#       without a second walk of the tree (--lpl-title-labels to label
+#       entries by game title instead).
 #
 #   -c  Replace filesystem-illegal characters (& * / : ` < > ? \ |) in
 #       thumbnail PNG filenames with underscores.
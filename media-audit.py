@@ -0,0 +1,255 @@
+"""
+Audit ROM / media coverage across a launchbox-export.py output tree.
+
+Requirements: Python 3.9+ (standard library only).
+
+Python replacement for thumb_helper.sh's matchsearch. Every folder is
+listed exactly once (one scandir per ROM folder and per media folder)
+and coverage is computed with set differences on file basenames, so a
+platform costs a handful of directory scans no matter how many ROMs or
+covers it has. Matching is by basename without extension, case-sensitive,
+which is how launchbox-export.py names media and how Batocera looks it up.
+
+For each platform folder and each media type it reports:
+    - ROMs with no media file of that type   ("missing")
+    - media files with no matching ROM       ("orphaned")
+
+Layout read:
+    export_dir/
+    └── <platform>/
+        ├── gamelist.xml
+        ├── <rom files>      (only present if exported with --copy-roms)
+        ├── covers/
+        ├── screenshots/
+        ├── marquees/
+        └── videos/
+
+Configuration (each constant below is also a CLI flag of the same name
+in kebab-case, e.g. ROMS_DIR <-> --roms-dir):
+
+    EXPORT_DIR      The launchbox-export.py OUTPUT_DIR to audit.
+    ROMS_DIR        Optional separate ROM tree laid out as
+                    <ROMS_DIR>/<platform>/<rom files>. If empty, ROMs are
+                    taken from the platform folder itself, and if it has
+                    none, from the <path> entries in its gamelist.xml.
+    REPORT_DIR      Where <platform>.json, <platform>.csv and summary.csv
+                    are written (default: <EXPORT_DIR>/_audit).
+    SYSTEMS         Platform folders to audit. Empty means every folder
+                    in EXPORT_DIR that has a gamelist.xml or media folder.
+    WORKERS         Platforms audited concurrently. Listing is latency
+                    bound on network shares, so threads help there.
+
+Run with -h for the full CLI flag list.
+"""
+
+import argparse
+import csv
+import json
+import os
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Set, Tuple
+
+
+# ============================================================================
+# CONFIGURATION (defaults — overridable via CLI flags)
+# ============================================================================
+
+EXPORT_DIR = r'R:\Launchbox-Export'
+ROMS_DIR = ""
+REPORT_DIR = ""
+SYSTEMS: List[str] = []
+WORKERS = 8
+
+# Output subfolders checked for coverage, as written by launchbox-export.py.
+MEDIA_FOLDERS = ["covers", "screenshots", "marquees", "videos"]
+
+# Files in a platform folder that are exporter bookkeeping, not ROMs.
+NON_ROM_SUFFIXES = (".xml", ".json", ".csv", ".tmp")
+
+
+# ============================================================================
+# SCANNING
+# ============================================================================
+
+def scan_stems(folder: str) -> Dict[str, str]:
+    """
+    List a folder once and return {basename without extension: filename}.
+
+    Missing folders yield an empty map. Subdirectories are ignored.
+    """
+    stems: Dict[str, str] = {}
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                if entry.is_file():
+                    stems.setdefault(os.path.splitext(entry.name)[0], entry.name)
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    return stems
+
+
+def scan_roms(system: str) -> Tuple[Set[str], str]:
+    """Return (rom basenames, where they came from) for one platform."""
+    if ROMS_DIR:
+        return set(scan_stems(os.path.join(ROMS_DIR, system))), "roms-dir"
+
+    platform_dir = os.path.join(EXPORT_DIR, system)
+    roms = {
+        stem for stem, name in scan_stems(platform_dir).items()
+        if not name.lower().endswith(NON_ROM_SUFFIXES)
+    }
+    if roms:
+        return roms, "platform-dir"
+
+    gamelist = os.path.join(platform_dir, "gamelist.xml")
+    try:
+        root = ET.parse(gamelist).getroot()
+    except (OSError, ET.ParseError):
+        return set(), "none"
+    roms = {
+        os.path.splitext(os.path.basename(path))[0]
+        for path in (game.findtext("path") for game in root.iter("game"))
+        if path
+    }
+    return roms, "gamelist"
+
+
+def audit_system(system: str) -> Dict:
+    """Compute both-direction coverage for every media folder of one platform."""
+    roms, rom_source = scan_roms(system)
+    report: Dict = {
+        "system": system,
+        "rom_source": rom_source,
+        "roms": len(roms),
+        "media": {},
+    }
+
+    for folder in MEDIA_FOLDERS:
+        media = set(scan_stems(os.path.join(EXPORT_DIR, system, folder)))
+        report["media"][folder] = {
+            "files": len(media),
+            "matched": len(roms & media),
+            "missing": sorted(roms - media),
+            "orphaned": sorted(media - roms),
+        }
+    return report
+
+
+def list_systems() -> List[str]:
+    """Every platform folder in EXPORT_DIR that looks like exporter output."""
+    systems = []
+    with os.scandir(EXPORT_DIR) as it:
+        for entry in it:
+            if not entry.is_dir() or entry.name.startswith(("_", ".")):
+                continue
+            markers = ["gamelist.xml"] + MEDIA_FOLDERS
+            if any(os.path.exists(os.path.join(entry.path, m)) for m in markers):
+                systems.append(entry.name)
+    return sorted(systems)
+
+
+# ============================================================================
+# REPORTING
+# ============================================================================
+
+def write_reports(report: Dict, report_dir: str) -> None:
+    """Write <system>.json (full report) and <system>.csv (one row per issue)."""
+    system = report["system"]
+    with open(os.path.join(report_dir, f"{system}.json"), "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    with open(os.path.join(report_dir, f"{system}.csv"), "w",
+              encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["media", "issue", "name"])
+        for folder, stats in report["media"].items():
+            for name in stats["missing"]:
+                writer.writerow([folder, "missing", name])
+            for name in stats["orphaned"]:
+                writer.writerow([folder, "orphaned", name])
+
+
+def write_summary(reports: List[Dict], report_dir: str) -> None:
+    """Write summary.csv: one row per platform and media folder."""
+    with open(os.path.join(report_dir, "summary.csv"), "w",
+              encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["system", "rom_source", "roms", "media", "files",
+                         "matched", "missing", "orphaned"])
+        for report in reports:
+            for folder, stats in report["media"].items():
+                writer.writerow([
+                    report["system"], report["rom_source"], report["roms"], folder,
+                    stats["files"], stats["matched"],
+                    len(stats["missing"]), len(stats["orphaned"]),
+                ])
+
+
+def print_report(report: Dict) -> None:
+    """Console summary in the spirit of thumb_helper.sh's output."""
+    print(f"\n{report['system']}  ({report['roms']} ROMs from {report['rom_source']})")
+    for folder, stats in report["media"].items():
+        line = f"  {folder:<12} matched {stats['matched']:>6} / {report['roms']}"
+        if stats["missing"]:
+            line += f"   ERROR: {len(stats['missing'])} missing"
+        if stats["orphaned"]:
+            line += f"   {len(stats['orphaned'])} orphaned"
+        print(line)
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Audit ROM/media coverage of a launchbox-export.py output tree."
+    )
+    parser.add_argument("--export-dir", default=EXPORT_DIR,
+                        help="Export tree to audit (default: %(default)s)")
+    parser.add_argument("--roms-dir", default=ROMS_DIR,
+                        help="Separate <roms-dir>/<platform>/ ROM tree (optional)")
+    parser.add_argument("--report-dir", default=REPORT_DIR,
+                        help="Report destination (default: <export-dir>/_audit)")
+    parser.add_argument("--systems", nargs="*", default=SYSTEMS,
+                        help="Platform folders to audit (default: all)")
+    parser.add_argument("--workers", type=int, default=WORKERS,
+                        help="Platforms audited concurrently (default: %(default)s)")
+    return parser.parse_args()
+
+
+def main() -> None:
+    global EXPORT_DIR, ROMS_DIR, REPORT_DIR, SYSTEMS, WORKERS
+
+    args = parse_args()
+    EXPORT_DIR = args.export_dir
+    ROMS_DIR   = args.roms_dir
+    REPORT_DIR = args.report_dir or os.path.join(EXPORT_DIR, "_audit")
+    SYSTEMS    = args.systems or list_systems()
+    WORKERS    = args.workers
+
+    started = time.monotonic()
+    os.makedirs(REPORT_DIR, exist_ok=True)
+
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        reports = list(executor.map(audit_system, SYSTEMS))
+
+    for report in reports:
+        write_reports(report, REPORT_DIR)
+        print_report(report)
+    write_summary(reports, REPORT_DIR)
+
+    total_missing = sum(
+        len(stats["missing"]) for r in reports for stats in r["media"].values()
+    )
+    print("\n" + "=" * 70)
+    print(f"Audited {len(reports)} platforms in {time.monotonic() - started:.1f}s")
+    print(f"  Missing media entries: {total_missing:,}")
+    print(f"  Reports: {REPORT_DIR}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,10 @@
 #   - ROMs that have no matching cover PNG
 #   - Cover PNGs that have no matching ROM
 #
+# For launchbox-export.py output trees, media-audit.py does the same
+# check for every media type with one directory scan per folder and
+# writes JSON/CSV reports; prefer it on large systems.
+#
 # Does not modify anything; the rename/move/delete lines are commented
 # out. See retro-commands.md for the ImageMagick and ROM-patching
 # one-liners that used to live at the bottom of this file.